@@ -11,6 +11,7 @@ from table import TableManager
 from sql import (
     SQLLexer,
     SQLParser,
+    parse_sql,
     SQLExecutor,
     SelectStatement,
     InsertStatement,
@@ -153,13 +154,8 @@ class SimpleDatabase:
             }
 
         try:
-            # 词法分析
-            lexer = SQLLexer(sql.strip())
-            tokens = lexer.tokenize()
-
-            # 语法分析
-            parser = SQLParser(tokens)
-            ast = parser.parse()
+            # 词法+语法分析（相同SQL复用缓存的token流）
+            ast = parse_sql(sql.strip())
 
             # 权限检查 - admin用户跳过权限检查
             if self.current_user != "admin":
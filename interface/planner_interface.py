@@ -66,16 +66,10 @@ class PlanGeneratorInterface:
             执行计划结果
         """
         try:
-            from sql.lexer import SQLLexer
-            from sql.parser import SQLParser
+            from sql.parser import parse_sql
 
-            # 词法分析
-            lexer = SQLLexer(sql)
-            tokens = lexer.tokenize()
-
-            # 语法分析
-            parser = SQLParser(tokens)
-            ast = parser.parse()
+            # 词法+语法分析（重复EXPLAIN同一条SQL时复用缓存的token流）
+            ast = parse_sql(sql)
 
             # 生成执行计划
             return self.generate_execution_plan(ast, output_format)
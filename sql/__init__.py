@@ -3,7 +3,7 @@ SQL处理层模块
 """
 
 from .lexer import SQLLexer, Token, TokenType
-from .parser import SQLParser
+from .parser import SQLParser, parse_sql
 from .executor import SQLExecutor
 from .ast_nodes import *
 from .semantic import SemanticAnalyzer, SemanticError
@@ -12,6 +12,7 @@ from .diagnostics import DiagnosticEngine
 __all__ = [
     "SQLLexer",
     "SQLParser",
+    "parse_sql",
     "SQLExecutor",
     "Token",
     "TokenType",
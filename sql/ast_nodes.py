@@ -9,25 +9,41 @@ from typing import Any, List, Dict, Optional, Union
 class ASTNode(ABC):
     """抽象语法树节点基类"""
 
-    pass
+    __slots__ = ()
+
+    def __setstate__(self, state):
+        """
+        恢复pickle状态。系统目录中持久化的CHECK表达式等节点可能由引入__slots__之前的
+        版本写入，其状态是普通的__dict__字典；当前版本写入的则是(None, slots字典)元组
+        """
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+        else:
+            dict_state, slot_state = state, None
+        for mapping in (dict_state, slot_state):
+            if mapping:
+                for name, value in mapping.items():
+                    setattr(self, name, value)
 
 
 class Expression(ASTNode):
     """表达式基类"""
 
-    pass
+    __slots__ = ()
 
 
 class Statement(ASTNode):
     """语句基类"""
 
-    pass
+    __slots__ = ()
 
 
 # 表达式节点
 class ColumnRef(Expression):
     """列引用"""
 
+    __slots__ = ("column_name", "table_name", "line", "column")
+
     def __init__(self, column_name: str, table_name: str = None, line: int = None, column: int = None):
         self.column_name = column_name
         self.table_name = table_name
@@ -42,7 +58,11 @@ class ColumnRef(Expression):
 
 
 class Literal(Expression):
-    """字面量"""
+    """字面量
+    解析器会在多条语句之间共享数字与NULL/TRUE/FALSE字面量节点，节点创建后不可原地修改。
+    """
+
+    __slots__ = ("value", "data_type")
 
     def __init__(self, value: Any, data_type: str):
         self.value = value
@@ -56,6 +76,8 @@ class Literal(Expression):
 class BinaryOp(Expression):
     """二元操作符"""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expression, operator: str, right: Expression):
         self.left = left
         self.operator = operator
@@ -69,6 +91,8 @@ class BinaryOp(Expression):
 class LogicalOp(Expression):
     """逻辑操作符 (AND, OR)"""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(self, left: Expression, operator: str, right: Expression):
         self.left = left
         self.operator = operator  # 'AND', 'OR'
@@ -81,6 +105,8 @@ class LogicalOp(Expression):
 class AggregateFunction(Expression):
     """聚合函数表达式，如COUNT(col), SUM(col)等"""
 
+    __slots__ = ("func_name", "arg", "line", "column")
+
     def __init__(self, func_name: str, arg: Any, line: int = None, column: int = None):
         self.func_name = func_name.upper()
         self.arg = arg  # 可以是ColumnRef、'*'等
@@ -95,6 +121,16 @@ class AggregateFunction(Expression):
 class CreateTableStatement(Statement):
     """CREATE TABLE 语句"""
 
+    __slots__ = (
+        "table_name",
+        "columns",
+        "table_constraints",
+        "if_exists",
+        "if_not_exists",
+        "line",
+        "column",
+    )
+
     def __init__(
         self,
         table_name: str,
@@ -121,6 +157,8 @@ class CreateTableStatement(Statement):
 class InsertStatement(Statement):
     """INSERT 语句"""
 
+    __slots__ = ("table_name", "columns", "values", "line", "column")
+
     def __init__(
         self, table_name: str, columns: List[str], values: List[List[Expression]], line: int = None, column: int = None
     ):
@@ -135,6 +173,8 @@ class InsertStatement(Statement):
 
 
 class OrderItem(ASTNode):
+    __slots__ = ("expr", "direction")
+
     def __init__(self, expr: Union[ColumnRef, str], direction: str = "ASC"):
         self.expr = expr
         self.direction = direction.upper()
@@ -146,6 +186,8 @@ class OrderItem(ASTNode):
 class SelectStatement(Statement):
     """SELECT 语句"""
 
+    __slots__ = ("columns", "from_table", "where_clause", "group_by", "order_by")
+
     def __init__(
         self,
         columns: List[Union[ColumnRef, str, AggregateFunction]],
@@ -176,6 +218,8 @@ class SelectStatement(Statement):
 class UpdateStatement(Statement):
     """UPDATE 语句"""
 
+    __slots__ = ("table_name", "set_clauses", "where_clause", "line", "column")
+
     def __init__(
         self,
         table_name: str,
@@ -203,6 +247,8 @@ class UpdateStatement(Statement):
 class DeleteStatement(Statement):
     """DELETE 语句"""
 
+    __slots__ = ("table_name", "where_clause", "line", "column")
+
     def __init__(self, table_name: str, where_clause: Optional[Expression] = None, line: int = None, column: int = None):
         self.table_name = table_name
         self.where_clause = where_clause
@@ -218,6 +264,9 @@ class DeleteStatement(Statement):
 
 class DropTableStatement(Statement):
     """DROP TABLE 语句"""
+
+    __slots__ = ("table_name", "if_exists", "if_not_exists", "line", "column")
+
     def __init__(self, table_name: str, if_exists: bool = False, if_not_exists: bool = False, line: int = None, column: int = None):
         self.table_name = table_name
         self.if_exists = if_exists
@@ -233,6 +282,8 @@ class DropTableStatement(Statement):
 class TruncateTableStatement(Statement):
     """TRUNCATE TABLE 语句"""
 
+    __slots__ = ("table_name",)
+
     def __init__(self, table_name: str):
         self.table_name = table_name
 
@@ -244,6 +295,8 @@ class TruncateTableStatement(Statement):
 class CreateIndexNode(ASTNode):
     """创建索引AST节点"""
 
+    __slots__ = ("index_name", "table_name", "column_name", "is_unique")
+
     def __init__(
         self,
         index_name: str,
@@ -260,12 +313,17 @@ class CreateIndexNode(ASTNode):
 class DropIndexNode(ASTNode):
     """删除索引AST节点"""
 
+    __slots__ = ("index_name",)
+
     def __init__(self, index_name: str):
         self.index_name = index_name
 
 
 class CreateIndexStatement(Statement):
     """CREATE INDEX语句"""
+
+    __slots__ = ("index_name", "table_name", "column_name", "is_unique", "if_not_exists")
+
     def __init__(
         self,
         index_name: str,
@@ -283,6 +341,9 @@ class CreateIndexStatement(Statement):
 
 class DropIndexStatement(Statement):
     """DROP INDEX语句"""
+
+    __slots__ = ("index_name", "if_exists")
+
     def __init__(self, index_name: str, if_exists: bool = False):
         self.index_name = index_name
         self.if_exists = if_exists
@@ -298,6 +359,8 @@ class JoinClause(ASTNode):
     on: 连接条件（Expression）
     """
 
+    __slots__ = ("left", "right", "join_type", "on")
+
     def __init__(
         self, left: Union[str, "JoinClause"], right: str, join_type: str, on: Expression
     ):
@@ -312,6 +375,8 @@ class JoinClause(ASTNode):
 
 # 视图相关语句
 class CreateViewStatement(Statement):
+    __slots__ = ("view_name", "view_definition", "if_not_exists")
+
     def __init__(self, view_name: str, view_definition: str, if_not_exists: bool = False):
         self.view_name = view_name
         self.view_definition = view_definition
@@ -320,6 +385,8 @@ class CreateViewStatement(Statement):
 
 
 class DropViewStatement(Statement):
+    __slots__ = ("view_name", "if_exists")
+
     def __init__(self, view_name: str, if_exists: bool = False):
         self.view_name = view_name
         self.if_exists = if_exists
@@ -329,6 +396,9 @@ class DropViewStatement(Statement):
 # 用户管理语句
 class CreateUserStatement(Statement):
     """CREATE USER 语句"""
+
+    __slots__ = ("username", "password", "if_not_exists")
+
     def __init__(self, username: str, password: str, if_not_exists: bool = False):
         self.username = username
         self.password = password
@@ -340,6 +410,9 @@ class CreateUserStatement(Statement):
 
 class DropUserStatement(Statement):
     """DROP USER 语句"""
+
+    __slots__ = ("username", "if_exists")
+
     def __init__(self, username: str, if_exists: bool = False):
         self.username = username
         self.if_exists = if_exists
@@ -352,6 +425,8 @@ class DropUserStatement(Statement):
 class GrantStatement(Statement):
     """GRANT 语句"""
 
+    __slots__ = ("privilege", "table_name", "username")
+
     def __init__(self, privilege: str, table_name: str, username: str):
         self.privilege = privilege  # SELECT, INSERT, UPDATE, DELETE, ALL
         self.table_name = table_name
@@ -364,6 +439,8 @@ class GrantStatement(Statement):
 class RevokeStatement(Statement):
     """REVOKE 语句"""
 
+    __slots__ = ("privilege", "table_name", "username")
+
     def __init__(self, privilege: str, table_name: str, username: str):
         self.privilege = privilege
         self.table_name = table_name
@@ -377,6 +454,8 @@ class RevokeStatement(Statement):
 class BeginTransaction(Statement):
     """BEGIN 或 START TRANSACTION"""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "BEGIN"
 
@@ -384,6 +463,8 @@ class BeginTransaction(Statement):
 class CommitTransaction(Statement):
     """COMMIT"""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "COMMIT"
 
@@ -391,6 +472,8 @@ class CommitTransaction(Statement):
 class RollbackTransaction(Statement):
     """ROLLBACK（当前不实现实际回滚）"""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "ROLLBACK"
 
@@ -398,6 +481,8 @@ class RollbackTransaction(Statement):
 class SetAutocommit(Statement):
     """SET AUTOCOMMIT = 0|1"""
 
+    __slots__ = ("enabled",)
+
     def __init__(self, enabled: bool):
         self.enabled = enabled
 
@@ -408,6 +493,8 @@ class SetAutocommit(Statement):
 class SetIsolationLevel(Statement):
     """SET SESSION TRANSACTION ISOLATION LEVEL ..."""
 
+    __slots__ = ("level",)
+
     def __init__(self, level: str):
         # level ∈ {READ UNCOMMITTED, READ COMMITTED, REPEATABLE READ, SERIALIZABLE}
         self.level = level
@@ -420,6 +507,8 @@ class SetIsolationLevel(Statement):
 class CreateTriggerStatement(Statement):
     """CREATE TRIGGER 语句"""
 
+    __slots__ = ("trigger_name", "timing", "event", "table_name", "statement")
+
     def __init__(
         self,
         trigger_name: str,
@@ -441,6 +530,8 @@ class CreateTriggerStatement(Statement):
 class DropTriggerStatement(Statement):
     """DROP TRIGGER 语句"""
 
+    __slots__ = ("trigger_name", "if_exists")
+
     def __init__(self, trigger_name: str, if_exists: bool = False):
         self.trigger_name = trigger_name
         self.if_exists = if_exists
@@ -453,6 +544,9 @@ class DropTriggerStatement(Statement):
 # ALTER TABLE 相关
 class AlterTableStatement(Statement):
     """ALTER TABLE 语句"""
+
+    __slots__ = ("table_name", "action", "column_def", "column_name")
+
     def __init__(self, table_name: str, action: str, column_def: dict = None, column_name: str = None):
         self.table_name = table_name
         self.action = action  # 'ADD' 或 'DROP'
@@ -470,6 +564,8 @@ class AlterTableStatement(Statement):
 class ShowStatement(Statement):
     """SHOW语句"""
 
+    __slots__ = ("show_type",)
+
     def __init__(self, show_type: str):
         self.show_type = show_type  # 'AUTOCOMMIT', 'ISOLATION_LEVEL', etc.
 
@@ -478,6 +574,8 @@ class ShowStatement(Statement):
 
 
 class OpenCursorStatement(Statement):
+    __slots__ = ("cursor_name", "select_stmt")
+
     def __init__(self, cursor_name: str, select_stmt: Statement):
         self.cursor_name = cursor_name
         self.select_stmt = select_stmt
@@ -485,6 +583,8 @@ class OpenCursorStatement(Statement):
         return f"OPEN CURSOR {self.cursor_name} FOR {self.select_stmt}"
 
 class FetchCursorStatement(Statement):
+    __slots__ = ("count", "cursor_name")
+
     def __init__(self, count: int, cursor_name: str):
         self.count = count
         self.cursor_name = cursor_name
@@ -492,6 +592,8 @@ class FetchCursorStatement(Statement):
         return f"FETCH {self.count} FROM {self.cursor_name}"
 
 class CloseCursorStatement(Statement):
+    __slots__ = ("cursor_name",)
+
     def __init__(self, cursor_name: str):
         self.cursor_name = cursor_name
     def __repr__(self):
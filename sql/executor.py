@@ -313,13 +313,10 @@ class SQLExecutor:
                     if not view_sql.strip().endswith(';'):
                         view_sql = view_sql.strip() + ';'
                     # print(f"[EXECUTOR DEBUG] view SQL: {view_sql}")
-                    from sql.lexer import SQLLexer
-                    from sql.parser import SQLParser
+                    from sql.parser import parse_sql
 
-                    lexer = SQLLexer(view_sql)
-                    tokens = lexer.tokenize()
-                    parser = SQLParser(tokens)
-                    view_ast = parser.parse()
+                    # 视图定义文本固定不变，每次查询视图都会命中解析缓存
+                    view_ast = parse_sql(view_sql)
                     # print(f"[EXECUTOR DEBUG] parsed view AST: {type(view_ast).__name__} -> {view_ast}")
 
                     # 步骤 1: 执行视图定义，得到原始结果（list of dict）
@@ -1960,12 +1957,8 @@ class SQLExecutor:
             if not stmt.endswith(';'):
                 stmt += ';'
             try:
-                from sql.lexer import SQLLexer
-                from sql.parser import SQLParser
-                lexer = SQLLexer(stmt)
-                tokens = lexer.tokenize()
-                parser = SQLParser(tokens)
-                ast = parser.parse()
+                from sql.parser import parse_sql
+                ast = parse_sql(stmt)
                 res = self.execute(ast)
                 results.append(res)
             except Exception as e:
@@ -79,6 +79,9 @@ class TokenType(Enum):
     GROUP = "GROUP"
     BY = "BY"
     ORDER = "ORDER"
+    # 复合关键字：词法阶段合并 GROUP BY / ORDER BY
+    GROUP_BY = "GROUP BY"
+    ORDER_BY = "ORDER BY"
     ASC = "ASC"
     DESC = "DESC"
     # 在TokenType枚举中添加
@@ -252,6 +255,30 @@ class SQLLexer:
         "CURSOR": TokenType.CURSOR,
     }
 
+    # 后面紧跟 BY 时合并为单个token的关键字
+    COMPOUND_BY_KEYWORDS = {
+        TokenType.GROUP: TokenType.GROUP_BY,
+        TokenType.ORDER: TokenType.ORDER_BY,
+    }
+
+    # 无需向后看的单字符符号
+    SINGLE_CHAR_TOKENS = {
+        "=": TokenType.EQUALS,
+        "+": TokenType.PLUS,
+        "-": TokenType.MINUS,
+        "*": TokenType.STAR,
+        "/": TokenType.SLASH,
+        ",": TokenType.COMMA,
+        ";": TokenType.SEMICOLON,
+        "(": TokenType.LEFT_PAREN,
+        ")": TokenType.RIGHT_PAREN,
+    }
+
+    # 空白串与标识符尾部交给正则在C层一次扫描完，不再逐字符循环
+    # （\s 与 str.isspace、\w 与 str.isalnum 或 "_" 的字符判定一致）
+    _WHITESPACE_RE = re.compile(r"\s+")
+    _WORD_RE = re.compile(r"\w*")
+
     def __init__(self, sql: str):
         self.sql = sql
         self.position = 0
@@ -272,48 +299,33 @@ class SQLLexer:
             char = self.sql[self.position]
 
             if char == '#':
-                # 跳过注释到行尾
-                while self.position < len(self.sql) and self.sql[self.position] != '\n':
-                    self.position += 1
+                self._skip_comment()
                 continue
 
             if char.isalpha() or char == "_":
                 self._read_identifier_or_keyword()
             elif char.isdigit() or (char == "-" and self._lookahead_is_digit()):
                 self._read_number()
+            elif char in self.SINGLE_CHAR_TOKENS:
+                self._add_single_char_token(self.SINGLE_CHAR_TOKENS[char], char)
             elif char in ("'", '"'):
                 self._read_string(char)
-            elif char == "=":
-                self._add_single_char_token(TokenType.EQUALS, char)
             elif char == "<":
                 self._read_less_than()
             elif char == ">":
                 self._read_greater_than()
             elif char == "!":
                 self._read_not_equal()
-            elif char == "+":
-                self._add_single_char_token(TokenType.PLUS, char)
-            elif char == "-":
-                self._add_single_char_token(TokenType.MINUS, char)
-            elif char == "*":
-                self._add_single_char_token(TokenType.STAR, char)
-            elif char == "/":
-                self._add_single_char_token(TokenType.SLASH, char)
-            elif char == ",":
-                self._add_single_char_token(TokenType.COMMA, char)
-            elif char == ";":
-                self._add_single_char_token(TokenType.SEMICOLON, char)
-            elif char == "(":
-                self._add_single_char_token(TokenType.LEFT_PAREN, char)
-            elif char == ")":
-                self._add_single_char_token(TokenType.RIGHT_PAREN, char)
-            elif char == "*":
-                self._add_single_char_token(TokenType.STAR, char)
             elif char == ".":
                 self._read_dot()
             elif char == "\\":
                 # 处理反斜杠：可能是转义字符或路径分隔符
                 self._read_backslash()
+            elif char == "；":
+                # 中文分号单独给出明确提示，避免被当成普通的未识别字符
+                raise SyntaxError(
+                    f"仅支持英文分号 ';' 作为语句结束符，检测到中文分号 '；' 在行 {self.line}, 列 {self.column}"
+                )
             else:
                 raise SyntaxError(
                     f"未识别的字符 '{char}' 在行 {self.line}, 列 {self.column}"
@@ -330,13 +342,23 @@ class SQLLexer:
 
     def _skip_whitespace(self):
         """跳过空白字符"""
-        while self.position < len(self.sql) and self.sql[self.position].isspace():
-            if self.sql[self.position] == "\n":
-                self.line += 1
-                self.column = 1
-            else:
-                self.column += 1
-            self.position += 1
+        match = self._WHITESPACE_RE.match(self.sql, self.position)
+        if match is None:
+            return
+        run = match.group()
+        self.position = match.end()
+        newlines = run.count("\n")
+        if newlines:
+            # 换行后列号从1开始，再加上最后一个换行之后的空白数
+            self.line += newlines
+            self.column = len(run) - run.rfind("\n")
+        else:
+            self.column += len(run)
+
+    def _skip_comment(self):
+        """跳过注释到行尾（换行符留给_skip_whitespace处理）"""
+        end = self.sql.find("\n", self.position)
+        self.position = len(self.sql) if end == -1 else end
 
     def _lookahead_is_digit(self) -> bool:
         return (self.position + 1 < len(self.sql)) and self.sql[self.position + 1].isdigit()
@@ -346,17 +368,46 @@ class SQLLexer:
         start = self.position
         start_column = self.column
 
-        while self.position < len(self.sql) and (
-            self.sql[self.position].isalnum() or self.sql[self.position] == "_"
-        ):
-            self.position += 1
-            self.column += 1
+        end = self._WORD_RE.match(self.sql, start).end()
+        self.position = end
+        self.column += end - start
 
-        value = self.sql[start : self.position]
+        value = self.sql[start:end]
         token_type = self.KEYWORDS.get(value.upper(), TokenType.IDENTIFIER)
-        token = Token(token_type, value, self.line, start_column)
+        start_line = self.line
+        compound_type = self.COMPOUND_BY_KEYWORDS.get(token_type)
+        if compound_type is not None:
+            by_value = self._read_following_by()
+            if by_value is not None:
+                token_type = compound_type
+                value = f"{value} {by_value}"
+        token = Token(token_type, value, start_line, start_column)
         self.tokens.append(token)
 
+    def _read_following_by(self):
+        """若后面（跳过空白与#注释）紧跟关键字 BY，则连同其间内容一起读掉并返回其原文，否则不移动位置并返回None"""
+        sql = self.sql
+        length = len(sql)
+        saved = (self.position, self.line, self.column)
+        while True:
+            self._skip_whitespace()
+            if self.position < length and sql[self.position] == "#":
+                self._skip_comment()
+            else:
+                break
+        pos = self.position
+        end = pos + 2
+        if (
+            pos == saved[0]
+            or sql[pos:end].upper() != "BY"
+            or (end < length and (sql[end].isalnum() or sql[end] == "_"))
+        ):
+            self.position, self.line, self.column = saved
+            return None
+        self.position = end
+        self.column += 2
+        return sql[pos:end]
+
     def _read_number(self):
         """读取数字（整数或浮点数），支持可选的负号"""
         start = self.position
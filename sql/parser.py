@@ -2,168 +2,403 @@
 SQL语法分析器
 """
 
-from typing import List, Union
+import os
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 from sql import Token, TokenType
+from .lexer import SQLLexer
 from .ast_nodes import *
 
 
+# TokenType成员的模块级别名：Python 3.11 中经枚举类读取成员要走描述符查找，
+# 比直接读取模块全局变量慢数倍，解析热点路径统一使用这些别名
+_TT_SELECT = TokenType.SELECT
+_TT_FROM = TokenType.FROM
+_TT_WHERE = TokenType.WHERE
+_TT_INSERT = TokenType.INSERT
+_TT_INTO = TokenType.INTO
+_TT_VALUES = TokenType.VALUES
+_TT_CREATE = TokenType.CREATE
+_TT_TABLE = TokenType.TABLE
+_TT_INTEGER = TokenType.INTEGER
+_TT_VARCHAR = TokenType.VARCHAR
+_TT_FLOAT = TokenType.FLOAT
+_TT_BOOLEAN = TokenType.BOOLEAN
+_TT_CHAR = TokenType.CHAR
+_TT_DECIMAL = TokenType.DECIMAL
+_TT_DATE = TokenType.DATE
+_TT_TIME = TokenType.TIME
+_TT_DATETIME = TokenType.DATETIME
+_TT_BIGINT = TokenType.BIGINT
+_TT_TINYINT = TokenType.TINYINT
+_TT_TEXT = TokenType.TEXT
+_TT_PRIMARY = TokenType.PRIMARY
+_TT_KEY = TokenType.KEY
+_TT_NOT = TokenType.NOT
+_TT_NULL = TokenType.NULL
+_TT_AND = TokenType.AND
+_TT_OR = TokenType.OR
+_TT_STAR = TokenType.STAR
+_TT_DOT = TokenType.DOT
+_TT_UNIQUE = TokenType.UNIQUE
+_TT_INDEX = TokenType.INDEX
+_TT_ON = TokenType.ON
+_TT_DROP = TokenType.DROP
+_TT_JOIN = TokenType.JOIN
+_TT_INNER = TokenType.INNER
+_TT_LEFT = TokenType.LEFT
+_TT_RIGHT = TokenType.RIGHT
+_TT_COUNT = TokenType.COUNT
+_TT_SUM = TokenType.SUM
+_TT_AVG = TokenType.AVG
+_TT_MIN = TokenType.MIN
+_TT_MAX = TokenType.MAX
+_TT_UPDATE = TokenType.UPDATE
+_TT_DELETE = TokenType.DELETE
+_TT_SET = TokenType.SET
+_TT_DEFAULT = TokenType.DEFAULT
+_TT_CHECK = TokenType.CHECK
+_TT_FOREIGN = TokenType.FOREIGN
+_TT_REFERENCES = TokenType.REFERENCES
+_TT_BEGIN = TokenType.BEGIN
+_TT_START = TokenType.START
+_TT_TRANSACTION = TokenType.TRANSACTION
+_TT_COMMIT = TokenType.COMMIT
+_TT_ROLLBACK = TokenType.ROLLBACK
+_TT_AUTOCOMMIT = TokenType.AUTOCOMMIT
+_TT_SESSION = TokenType.SESSION
+_TT_ISOLATION = TokenType.ISOLATION
+_TT_LEVEL = TokenType.LEVEL
+_TT_READ = TokenType.READ
+_TT_COMMITTED_KW = TokenType.COMMITTED_KW
+_TT_UNCOMMITTED_KW = TokenType.UNCOMMITTED_KW
+_TT_REPEATABLE = TokenType.REPEATABLE
+_TT_SERIALIZABLE = TokenType.SERIALIZABLE
+_TT_TRUNCATE = TokenType.TRUNCATE
+_TT_VIEW = TokenType.VIEW
+_TT_AS = TokenType.AS
+_TT_BY = TokenType.BY
+_TT_GROUP_BY = TokenType.GROUP_BY
+_TT_ORDER_BY = TokenType.ORDER_BY
+_TT_ASC = TokenType.ASC
+_TT_DESC = TokenType.DESC
+_TT_USER = TokenType.USER
+_TT_IDENTIFIED = TokenType.IDENTIFIED
+_TT_GRANT = TokenType.GRANT
+_TT_REVOKE = TokenType.REVOKE
+_TT_TO = TokenType.TO
+_TT_ALL = TokenType.ALL
+_TT_PRIVILEGES = TokenType.PRIVILEGES
+_TT_IF = TokenType.IF
+_TT_EXISTS = TokenType.EXISTS
+_TT_TRIGGER = TokenType.TRIGGER
+_TT_BEFORE = TokenType.BEFORE
+_TT_AFTER = TokenType.AFTER
+_TT_FOR = TokenType.FOR
+_TT_EACH = TokenType.EACH
+_TT_ROW = TokenType.ROW
+_TT_ALTER = TokenType.ALTER
+_TT_ADD = TokenType.ADD
+_TT_COLUMN = TokenType.COLUMN
+_TT_SHOW = TokenType.SHOW
+_TT_OPEN = TokenType.OPEN
+_TT_FETCH = TokenType.FETCH
+_TT_CLOSE = TokenType.CLOSE
+_TT_CURSOR = TokenType.CURSOR
+_TT_TRUE = TokenType.TRUE
+_TT_FALSE = TokenType.FALSE
+_TT_IDENTIFIER = TokenType.IDENTIFIER
+_TT_NUMBER = TokenType.NUMBER
+_TT_STRING = TokenType.STRING
+_TT_EQUALS = TokenType.EQUALS
+_TT_LESS_THAN = TokenType.LESS_THAN
+_TT_GREATER_THAN = TokenType.GREATER_THAN
+_TT_LESS_EQUAL = TokenType.LESS_EQUAL
+_TT_GREATER_EQUAL = TokenType.GREATER_EQUAL
+_TT_NOT_EQUAL = TokenType.NOT_EQUAL
+_TT_PLUS = TokenType.PLUS
+_TT_MINUS = TokenType.MINUS
+_TT_SLASH = TokenType.SLASH
+_TT_COMMA = TokenType.COMMA
+_TT_SEMICOLON = TokenType.SEMICOLON
+_TT_LEFT_PAREN = TokenType.LEFT_PAREN
+_TT_RIGHT_PAREN = TokenType.RIGHT_PAREN
+_TT_EOF = TokenType.EOF
+
+# 列定义中可出现的数据类型token及其规范的大写类型名
+_DATA_TYPE_NAMES = {
+    _TT_INTEGER: "INTEGER",
+    _TT_VARCHAR: "VARCHAR",
+    _TT_FLOAT: "FLOAT",
+    _TT_BOOLEAN: "BOOLEAN",
+    _TT_CHAR: "CHAR",
+    _TT_DECIMAL: "DECIMAL",
+    _TT_DATE: "DATE",
+    _TT_TIME: "TIME",
+    _TT_DATETIME: "DATETIME",
+    _TT_BIGINT: "BIGINT",
+    _TT_TINYINT: "TINYINT",
+    _TT_TEXT: "TEXT",
+}
+
+# SELECT * FROM t 之后可以直接进入 WHERE/GROUP BY/ORDER BY 尾部处理的token
+_SIMPLE_SELECT_TAIL_TOKENS = frozenset({
+    _TT_SEMICOLON,
+    _TT_EOF,
+    _TT_WHERE,
+    _TT_GROUP_BY,
+    _TT_ORDER_BY,
+})
+
+# JOIN子句的起始token
+_JOIN_START_TOKENS = frozenset({
+    _TT_JOIN,
+    _TT_INNER,
+    _TT_LEFT,
+    _TT_RIGHT,
+})
+
+# 排序方向token -> 规范方向名（不必对token文本逐个 upper()）
+_ORDER_DIRECTIONS = {
+    _TT_ASC: "ASC",
+    _TT_DESC: "DESC",
+}
+
+# 比较运算符
+_COMPARISON_TOKENS = frozenset({
+    _TT_EQUALS,
+    _TT_LESS_THAN,
+    _TT_GREATER_THAN,
+    _TT_LESS_EQUAL,
+    _TT_GREATER_EQUAL,
+    _TT_NOT_EQUAL,
+})
+
+# 算术运算符
+_ARITHMETIC_TOKENS = frozenset({
+    _TT_STAR,
+    _TT_PLUS,
+    _TT_MINUS,
+    _TT_SLASH,
+})
+
+# 聚合函数关键字
+_AGGREGATE_TOKENS = frozenset({
+    _TT_COUNT,
+    _TT_SUM,
+    _TT_AVG,
+    _TT_MIN,
+    _TT_MAX,
+})
+
+# 触发器时机与事件
+_TRIGGER_TIMING_TOKENS = frozenset({_TT_BEFORE, _TT_AFTER})
+_TRIGGER_EVENT_TOKENS = frozenset({_TT_INSERT, _TT_UPDATE, _TT_DELETE})
+
+# 逻辑运算符优先级：数值越大结合越紧
+_OR_PRECEDENCE = 1
+_AND_PRECEDENCE = 2
+_LOGICAL_PRECEDENCE = {
+    _TT_OR: _OR_PRECEDENCE,
+    _TT_AND: _AND_PRECEDENCE,
+}
+
+# 可作为权限名的关键字（GRANT/REVOKE）及其规范的大写权限名
+_PRIVILEGE_NAMES = {
+    _TT_SELECT: "SELECT",
+    _TT_INSERT: "INSERT",
+    _TT_UPDATE: "UPDATE",
+    _TT_DELETE: "DELETE",
+    _TT_CREATE: "CREATE",
+    _TT_DROP: "DROP",
+}
+
+# SET SESSION TRANSACTION ISOLATION LEVEL 后的关键字序列 -> 隔离级别名
+_ISOLATION_LEVELS = {
+    (_TT_SERIALIZABLE,): "SERIALIZABLE",
+    (_TT_READ, _TT_COMMITTED_KW): "READ COMMITTED",
+    (_TT_READ, _TT_UNCOMMITTED_KW): "READ UNCOMMITTED",
+    (_TT_REPEATABLE, _TT_READ): "REPEATABLE READ",
+}
+
+
+@lru_cache(maxsize=4096)
+def _number_literal(value: str) -> Literal:
+    """将NUMBER token文本转换为字面量节点
+    相同文本复用同一个节点（字面量节点创建后不会被修改），批量INSERT中重复出现的数字无需重复转换。
+    """
+    if "." in value:
+        return Literal(float(value), "FLOAT")
+    return Literal(int(value), "INTEGER")
+
+
+def _string_literal(value: str) -> Literal:
+    """字符串字面量节点。每次新建：字符串内容可能很长，且不应在多次解析之间共享而常驻内存"""
+    return Literal(value, "STRING")
+
+
+# NULL/TRUE/FALSE 字面量只有一种取值，全局共用
+_NULL_LITERAL = Literal(None, "NULL")
+_TRUE_LITERAL = Literal(True, "BOOLEAN")
+_FALSE_LITERAL = Literal(False, "BOOLEAN")
+
+# INSERT 值行快速路径：字面量token类型 -> 由token文本构造字面量节点的函数
+_ROW_LITERAL_FACTORIES = {
+    _TT_NUMBER: _number_literal,
+    _TT_STRING: _string_literal,
+    _TT_NULL: lambda value: _NULL_LITERAL,
+    _TT_TRUE: lambda value: _TRUE_LITERAL,
+    _TT_FALSE: lambda value: _FALSE_LITERAL,
+}
+
+# 值行中一个值之后可能出现的token
+_ROW_VALUE_END_TOKENS = frozenset({_TT_COMMA, _TT_RIGHT_PAREN})
+
+
+# 设置环境变量 MINISQL_PARSE_CACHE=0 可关闭 parse_sql 的token缓存，便于排查问题；
+# 超过 _PARSE_CACHE_MAX_SQL_LENGTH 个字符的SQL（如大批量INSERT脚本）不进缓存，
+# 只缓存短小且会重复提交的语句，避免一次性的大文本常驻内存
+# 携带口令等敏感信息的语句（CREATE/ALTER USER、GRANT、IDENTIFIED BY）同样不进缓存，
+# 以免明文凭据随缓存常驻内存；在全文中查找而非只看开头，前导注释也绕不过去
+_PARSE_CACHE_ENABLED = os.environ.get("MINISQL_PARSE_CACHE", "1") != "0"
+_PARSE_CACHE_MAX_SQL_LENGTH = 4096
+_SENSITIVE_SQL_RE = re.compile(r"\b(?:(?:CREATE|ALTER)\s+USER|GRANT|IDENTIFIED)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_cached(sql: str) -> Tuple[Token, ...]:
+    """按SQL原文缓存词法分析结果（Token为不可变的NamedTuple，可安全共享）"""
+    return tuple(SQLLexer(sql).tokenize())
+
+
+def parse_sql(sql: str) -> Statement:
+    """对一条SQL做词法+语法分析并返回AST
+    重复提交的相同SQL直接复用缓存的token流，省去占大头的词法分析；
+    AST每次重新构建，调用方（语义分析、自动纠错）可以放心修改其结构；
+    但数字与NULL/TRUE/FALSE字面量节点在多次解析之间共享，只能整体替换，不能原地修改。
+    """
+    if (
+        _PARSE_CACHE_ENABLED
+        and len(sql) <= _PARSE_CACHE_MAX_SQL_LENGTH
+        and _SENSITIVE_SQL_RE.search(sql) is None
+    ):
+        tokens = _tokenize_cached(sql)
+    else:
+        tokens = SQLLexer(sql).tokenize()
+    return SQLParser(tokens).parse()
+
+
 class SQLParser:
     """SQL语法分析器
     负责将Token流解析为AST语法树，支持多种SQL语句类型，包括DDL、DML、事务、权限、视图、触发器等。
     """
 
+    __slots__ = ("tokens", "position", "current_token", "_token_count", "_column_refs")
+
     def __init__(self, tokens: List[Token]):
         # 初始化，保存token流和当前位置
+        # 保证token流以EOF结尾，current_token因此永远不为None，各处无需再判空；
+        # 同时任何非EOF token之后必有下一个token，消费非EOF token时可以不做越界检查
+        if not tokens or tokens[-1].type is not _TT_EOF:
+            last = tokens[-1] if tokens else None
+            eof = Token(_TT_EOF, "", last.line if last else 1, last.column if last else 1)
+            tokens = list(tokens) + [eof]
         self.tokens = tokens
-        self.position = 0
-        self.current_token = tokens[0] if tokens else None
+        self.position: int = 0
+        self.current_token: Token = tokens[0]
+        # 缓存token总数，_advance/_peek_token_type 每次调用都要用到
+        self._token_count = len(tokens)
+        # 不带位置信息的列引用驻留表：(列名, 表名) -> ColumnRef
+        self._column_refs = {}
 
     def parse(self) -> Statement:
         """解析SQL语句（token流已去除#注释）
         主入口，根据首个token类型分发到不同的解析分支。
         """
-        # 检查是否有中文分号，防止中英文符号混用导致解析异常
-        for t in self.tokens:
-            if t.value == '；':
-                raise SyntaxError("仅支持英文分号 ';' 作为语句结束符，检测到中文分号 '；'")
-        # 如果token流为空或第一个token就是EOF，说明SQL为空，直接报错
-        if not self.current_token or self.current_token.type == TokenType.EOF:
+        # 如果第一个token就是EOF，说明SQL为空，直接报错
+        if self.current_token.type is _TT_EOF:
             raise SyntaxError("空的SQL语句")
-        # 下面根据首token类型分发到不同的解析分支，每个分支都对应一种SQL语句类型
-        if self.current_token.type == TokenType.CREATE:
-            # CREATE USER分支，专门处理用户创建
-            if self._peek_token_type(1) == TokenType.USER:
-                result = self._parse_create_user()
-            # CREATE VIEW分支，专门处理视图创建
-            elif self._peek_token_type(1) == TokenType.VIEW:
-                result = self._parse_create_view()
-            # CREATE TRIGGER分支，专门处理触发器创建
-            elif self._peek_token_type(1) == TokenType.TRIGGER:
-                result = self._parse_create_trigger()
-            # 其他CREATE分支，统一处理TABLE/INDEX等
-            else:
-                result = self._parse_create_statement()
-        elif self.current_token.type == TokenType.DROP:
-            # DROP USER分支，专门处理用户删除
-            if self._peek_token_type(1) == TokenType.USER:
-                result = self._parse_drop_user()
-            # DROP VIEW分支，专门处理视图删除
-            elif self._peek_token_type(1) == TokenType.VIEW:
-                result = self._parse_drop_view()
-            # DROP TRIGGER分支，专门处理触发器删除
-            elif self._peek_token_type(1) == TokenType.TRIGGER:
-                result = self._parse_drop_trigger()
-            # 其他DROP分支，统一处理TABLE/INDEX等
-            else:
-                result = self._parse_drop_statement()
-        elif self.current_token.type == TokenType.GRANT:
-            # 权限授予语句
-            result = self._parse_grant()
-        elif self.current_token.type == TokenType.REVOKE:
-            # 权限回收语句
-            result = self._parse_revoke()
-        elif self.current_token.type == TokenType.INSERT:
-            # 插入语句
-            result = self._parse_insert()
-        elif self.current_token.type == TokenType.SELECT:
-            # 查询语句
-            result = self._parse_select()
-        elif self.current_token.type == TokenType.UPDATE:  
-            # 更新语句
-            result = self._parse_update()
-        elif self.current_token.type == TokenType.DELETE:  
-            # 删除语句
-            result = self._parse_delete()
-        elif self.current_token.type == TokenType.BEGIN:
-            # BEGIN事务语句
-            result = self._parse_begin()
-        elif self.current_token.type == TokenType.START:
-            # START TRANSACTION事务语句，区别于BEGIN
-            result = self._parse_start_transaction()
-        elif self.current_token.type == TokenType.COMMIT:
-            # 提交事务
-            result = self._parse_commit()
-        elif self.current_token.type == TokenType.ROLLBACK:
-            # 回滚事务
-            result = self._parse_rollback()
-        elif self.current_token.type == TokenType.SET:
-            # SET相关配置
-            result = self._parse_set()
-        elif self.current_token.type == TokenType.TRUNCATE:
-            # TRUNCATE TABLE语句
-            result = self._parse_truncate()
-        elif self.current_token.type == TokenType.ALTER:
-            # ALTER TABLE语句
-            result = self._parse_alter_table()
-        elif self.current_token.type == TokenType.SHOW:
-            # SHOW相关配置
-            result = self._parse_show()
-            # 游标
-        elif self.current_token.type == TokenType.OPEN:
-            result = self._parse_open_cursor()
-        elif self.current_token.type == TokenType.FETCH:
-            result = self._parse_fetch_cursor()
-        elif self.current_token.type == TokenType.CLOSE:
-            result = self._parse_close_cursor()
-        else:
-            # 兜底分支：遇到未知或不支持的语句类型，直接报错
+        # 根据首token类型查表分发到对应的解析方法，每个方法对应一种SQL语句类型
+        parse_fn = self._STATEMENT_PARSERS.get(self.current_token.type)
+        if parse_fn is None:
+            # 兜底：遇到未知或不支持的语句类型，直接报错
             raise SyntaxError(f"不支持的语句类型: {self.current_token.value}")
+        result = parse_fn(self)
         # 统一要求所有SQL语句必须以英文分号结尾
-        self._expect(TokenType.SEMICOLON)
+        self._expect(_TT_SEMICOLON)
         return result
 
-    def _advance(self):
+    def _column_ref(self, column_name: str, table_name: Optional[str] = None) -> ColumnRef:
+        """获取不带位置信息的列引用（GROUP BY/ORDER BY），同一语句内相同的列共用一个节点
+        带行列号的列引用用于错误定位，仍各自创建。
+        """
+        key = (column_name, table_name)
+        ref = self._column_refs.get(key)
+        if ref is None:
+            ref = self._column_refs[key] = ColumnRef(column_name, table_name)
+        return ref
+
+    def _advance(self) -> None:
         """移动到下一个token"""
-        if self.position < len(self.tokens) - 1:
-            self.position += 1
-            self.current_token = self.tokens[self.position]
+        position = self.position + 1
+        if position < self._token_count:
+            self.position = position
+            self.current_token = self.tokens[position]
 
     def _expect(self, expected_type: TokenType) -> Token:
         """期望特定类型的token
         若当前token类型不符则抛出带行列号的语法错误。
         """
-        if not self.current_token or self.current_token.type != expected_type:
-            line = self.current_token.line if self.current_token else -1
-            column = self.current_token.column if self.current_token else -1
-            actual = self.current_token.value if self.current_token else 'EOF'
-            raise SyntaxError(str([line, column, f"期望{expected_type.value}, 实际{actual}"]))
         token = self.current_token
-        self._advance()
+        if token.type is not expected_type:
+            self._raise_expect(expected_type)
+        # 内联 _advance：_expect 几乎每个token都会调用一次；匹配到的token不是EOF，下一个token必然存在
+        self.position = position = self.position + 1
+        self.current_token = self.tokens[position]
         return token
 
-    def _peek_token_type(self, offset):
-        # 向前窥视offset个token，返回其类型
-        pos = self.position + offset
-        if 0 <= pos < len(self.tokens):
-            return self.tokens[pos].type
-        return None
+    def _expect_seq(self, *expected_types: TokenType) -> None:
+        """连续期望一串固定关键字（如 FOR EACH ROW），在一个循环内用局部变量走完
+        出错时先把当前位置移到不匹配的token上，错误信息与逐个 _expect 一致。
+        """
+        tokens = self.tokens
+        position = self.position
+        last = self._token_count - 1
+        for expected_type in expected_types:
+            token = tokens[position]
+            if token.type is not expected_type:
+                self.position = position
+                self.current_token = token
+                self._raise_expect(expected_type)
+            if position < last:
+                position += 1
+        self.position = position
+        self.current_token = tokens[position]
+
+    def _raise_expect(self, expected_type: TokenType) -> None:
+        """_expect 的出错分支：构造带行列号的语法错误，与热路径分开以保持 _expect 短小"""
+        token = self.current_token
+        raise SyntaxError(str([token.line, token.column, f"期望{expected_type.value}, 实际{token.value}"]))
+
+    def _peek_token_type(self) -> TokenType:
+        # 窥视下一个token的类型；调用方保证当前token不是EOF（EOF哨兵之前的token必有后继），无需越界检查
+        return self.tokens[self.position + 1].type
 
 
     def _parse_column_definition(self) -> dict:
         """解析列定义，支持DEFAULT、CHECK、FOREIGN KEY
         返回列名、类型、长度、约束、默认值、检查、外键等信息。
         """
-        column_name = self._expect(TokenType.IDENTIFIER).value
+        column_name = self._expect(_TT_IDENTIFIER).value
 
         # 解析数据类型
-        if self.current_token.type in (
-            TokenType.INTEGER,
-            TokenType.VARCHAR,
-            TokenType.FLOAT,
-            TokenType.BOOLEAN,
-            TokenType.CHAR,
-            TokenType.DECIMAL,
-            TokenType.DATE,
-            TokenType.TIME,
-            TokenType.DATETIME,
-            TokenType.BIGINT,
-            TokenType.TINYINT,
-            TokenType.TEXT,
-        ):
-            data_type = self.current_token.value.upper()
+        token = self.current_token
+        data_type = _DATA_TYPE_NAMES.get(token.type)
+        if data_type is not None:
             self._advance()
         else:
-           raise SyntaxError(str([self.current_token.line, self.current_token.column, f"期望数据类型，但得到 {self.current_token.value}"]))
+           raise SyntaxError(str([token.line, token.column, f"期望数据类型，但得到 {token.value}"]))
 
         # 解析长度（对于VARCHAR）
         length = None
@@ -171,421 +406,453 @@ class SQLParser:
         scale = None
         if (
             data_type in ("VARCHAR", "CHAR")
-            and self.current_token.type == TokenType.LEFT_PAREN
+            and self.current_token.type is _TT_LEFT_PAREN
         ):
             self._advance()
-            length = int(self._expect(TokenType.NUMBER).value)
-            self._expect(TokenType.RIGHT_PAREN)
-        elif data_type == "DECIMAL" and self.current_token.type == TokenType.LEFT_PAREN:
+            length = int(self._expect(_TT_NUMBER).value)
+            self._expect(_TT_RIGHT_PAREN)
+        elif data_type == "DECIMAL" and self.current_token.type is _TT_LEFT_PAREN:
             self._advance()
-            precision = int(self._expect(TokenType.NUMBER).value)
-            if self.current_token.type == TokenType.COMMA:
-                self._advance()
-                scale = int(self._expect(TokenType.NUMBER).value)
-            self._expect(TokenType.RIGHT_PAREN)
-
-        # 解析约束
-        constraints = []
-        default = None
-        check = None
-        foreign_key = None
-        while self.current_token and self.current_token.type in (
-            TokenType.PRIMARY,
-            TokenType.NOT,
-            TokenType.NULL,
-            TokenType.UNIQUE,
-            TokenType.DEFAULT,
-            TokenType.CHECK,
-            TokenType.FOREIGN,
-        ):
-            if self.current_token.type == TokenType.PRIMARY:
-                self._advance()
-                self._expect(TokenType.KEY)
-                constraints.append("PRIMARY KEY")
-            elif self.current_token.type == TokenType.NOT:
-                self._advance()
-                self._expect(TokenType.NULL)
-                constraints.append("NOT NULL")
-            elif self.current_token.type == TokenType.NULL:
-                self._advance()
-                constraints.append("NULL")
-            elif self.current_token.type == TokenType.UNIQUE:
-                self._advance()
-                constraints.append("UNIQUE")
-            elif self.current_token.type == TokenType.DEFAULT:
-                self._advance()
-                # 支持数字、字符串、布尔、NULL
-                if self.current_token.type == TokenType.NUMBER:
-                    default = self.current_token.value
-                    self._advance()
-                elif self.current_token.type == TokenType.STRING:
-                    default = self.current_token.value
-                    self._advance()
-                elif self.current_token.type == TokenType.TRUE:
-                    default = True
-                    self._advance()
-                elif self.current_token.type == TokenType.FALSE:
-                    default = False
-                    self._advance()
-                elif self.current_token.type == TokenType.NULL:
-                    default = None
-                    self._advance()
-                else:
-                    raise SyntaxError(str([self.current_token.line, self.current_token.column, f"不支持的DEFAULT值: {self.current_token.value}"]))
-            elif self.current_token.type == TokenType.CHECK:
-                self._advance()
-                self._expect(TokenType.LEFT_PAREN)
-                # 使用 WHERE 表达式解析，以支持比较/逻辑表达式
-                check = self._parse_where_expression()
-                self._expect(TokenType.RIGHT_PAREN)
-            elif self.current_token.type == TokenType.FOREIGN:
+            precision = int(self._expect(_TT_NUMBER).value)
+            if self.current_token.type is _TT_COMMA:
                 self._advance()
-                self._expect(TokenType.KEY)
-                self._expect(TokenType.REFERENCES)
-                ref_table = self._expect(TokenType.IDENTIFIER).value
-                self._expect(TokenType.LEFT_PAREN)
-                ref_column = self._expect(TokenType.IDENTIFIER).value
-                self._expect(TokenType.RIGHT_PAREN)
-                foreign_key = {"ref_table": ref_table, "ref_column": ref_column}
-
-        return {
+                scale = int(self._expect(_TT_NUMBER).value)
+            self._expect(_TT_RIGHT_PAREN)
+
+        column_def = {
             "name": column_name,
             "type": data_type,
             "length": length,
-            "constraints": constraints,
-            "default": default,
-            "check": check,
-            "foreign_key": foreign_key,
+            "constraints": [],
+            "default": None,
+            "check": None,
+            "foreign_key": None,
         }
 
+        # 解析约束：按当前token类型查表分发，各约束方法直接填写 column_def
+        constraint_parsers = self._CONSTRAINT_PARSERS
+        parse_fn = constraint_parsers.get(self.current_token.type)
+        while parse_fn is not None:
+            parse_fn(self, column_def)
+            parse_fn = constraint_parsers.get(self.current_token.type)
+        return column_def
+
+    def _parse_primary_key_constraint(self, column_def: dict) -> None:
+        self._advance()
+        self._expect(_TT_KEY)
+        column_def["constraints"].append("PRIMARY KEY")
+
+    def _parse_not_null_constraint(self, column_def: dict) -> None:
+        self._advance()
+        self._expect(_TT_NULL)
+        column_def["constraints"].append("NOT NULL")
+
+    def _parse_null_constraint(self, column_def: dict) -> None:
+        self._advance()
+        column_def["constraints"].append("NULL")
+
+    def _parse_unique_constraint(self, column_def: dict) -> None:
+        self._advance()
+        column_def["constraints"].append("UNIQUE")
+
+    def _parse_default_constraint(self, column_def: dict) -> None:
+        self._advance()
+        # 支持数字、字符串、布尔、NULL
+        value_token = self.current_token
+        if value_token.type is _TT_NUMBER or value_token.type is _TT_STRING:
+            default = value_token.value
+        elif value_token.type is _TT_TRUE:
+            default = True
+        elif value_token.type is _TT_FALSE:
+            default = False
+        elif value_token.type is _TT_NULL:
+            default = None
+        else:
+            raise SyntaxError(str([value_token.line, value_token.column, f"不支持的DEFAULT值: {value_token.value}"]))
+        self._advance()
+        column_def["default"] = default
+
+    def _parse_check_constraint(self, column_def: dict) -> None:
+        self._advance()
+        self._expect(_TT_LEFT_PAREN)
+        # 使用 WHERE 表达式解析，以支持比较/逻辑表达式
+        column_def["check"] = self._parse_where_expression()
+        self._expect(_TT_RIGHT_PAREN)
+
+    def _parse_foreign_key_constraint(self, column_def: dict) -> None:
+        self._advance()
+        self._expect(_TT_KEY)
+        self._expect(_TT_REFERENCES)
+        ref_table = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_LEFT_PAREN)
+        ref_column = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_RIGHT_PAREN)
+        column_def["foreign_key"] = {"ref_table": ref_table, "ref_column": ref_column}
+
+    # 列约束起始token -> 约束解析方法
+    _CONSTRAINT_PARSERS = {
+        _TT_PRIMARY: _parse_primary_key_constraint,
+        _TT_NOT: _parse_not_null_constraint,
+        _TT_NULL: _parse_null_constraint,
+        _TT_UNIQUE: _parse_unique_constraint,
+        _TT_DEFAULT: _parse_default_constraint,
+        _TT_CHECK: _parse_check_constraint,
+        _TT_FOREIGN: _parse_foreign_key_constraint,
+    }
+
     def _parse_insert(self) -> InsertStatement:
         """解析 INSERT 语句
         支持多行插入、可选列名。
         """
         start_line, start_column = self.current_token.line, self.current_token.column
-        self._expect(TokenType.INSERT)
-        self._expect(TokenType.INTO)
+        self._expect(_TT_INSERT)
+        self._expect(_TT_INTO)
 
-        table_name = self._expect(TokenType.IDENTIFIER).value
+        table_name = self._expect(_TT_IDENTIFIER).value
 
         # 解析列名（可选）
         columns = []
-        if self.current_token.type == TokenType.LEFT_PAREN:
+        if self.current_token.type is _TT_LEFT_PAREN:
             self._advance()
-            while self.current_token.type != TokenType.RIGHT_PAREN:
-                columns.append(self._expect(TokenType.IDENTIFIER).value)
-                if self.current_token.type == TokenType.COMMA:
+            while self.current_token.type is not _TT_RIGHT_PAREN:
+                columns.append(self._expect(_TT_IDENTIFIER).value)
+                if self.current_token.type is _TT_COMMA:
                     self._advance()
-                elif self.current_token.type != TokenType.RIGHT_PAREN:
+                elif self.current_token.type is not _TT_RIGHT_PAREN:
                     raise SyntaxError(str([self.current_token.line, self.current_token.column, "列名之间需要逗号分隔"]))
-            self._expect(TokenType.RIGHT_PAREN)
+            self._expect(_TT_RIGHT_PAREN)
 
-        self._expect(TokenType.VALUES)
+        self._expect(_TT_VALUES)
 
-        # 解析值列表
-        values = []
-        while True:
-            self._expect(TokenType.LEFT_PAREN)
-            row_values = []
-
-            while self.current_token.type != TokenType.RIGHT_PAREN:
-                value = self._parse_expression()
-                row_values.append(value)
+        # 解析值列表：第一行必有，其后每遇到逗号再解析一行
+        parse_value_row = self._parse_value_row
+        values = [parse_value_row()]
+        values_append = values.append
+        while self.current_token.type is _TT_COMMA:
+            self._advance()
+            values_append(parse_value_row())
 
-                if self.current_token.type == TokenType.COMMA:
-                    self._advance()
-                elif self.current_token.type != TokenType.RIGHT_PAREN:
-                    raise SyntaxError(str([self.current_token.line, self.current_token.column, "值之间需要逗号分隔"]))
+        return InsertStatement(table_name, columns, values, start_line, start_column)
 
-            self._expect(TokenType.RIGHT_PAREN)
-            values.append(row_values)
+    def _parse_value_row(self) -> List[Expression]:
+        """解析 INSERT 的一行值 (expr, expr, ...)（批量插入的热点循环，方法与token均绑定到局部变量）"""
+        self._expect(_TT_LEFT_PAREN)
+        row_values = []
+        row_append = row_values.append
+        parse_expression = self._parse_expression
+        tokens = self.tokens
 
-            # 检查是否还有更多值行
-            if self.current_token.type == TokenType.COMMA:
-                self._advance()
+        token = self.current_token
+        while token.type is not _TT_RIGHT_PAREN:
+            # 快速路径：后面紧跟逗号或右括号的单个字面量，直接构造节点，不走表达式解析
+            make_literal = _ROW_LITERAL_FACTORIES.get(token.type)
+            position = self.position + 1
+            if make_literal is not None and tokens[position].type in _ROW_VALUE_END_TOKENS:
+                row_append(make_literal(token.value))
+                self.position = position
+                self.current_token = token = tokens[position]
             else:
-                break
+                row_append(parse_expression())
+                token = self.current_token
 
-        return InsertStatement(table_name, columns, values, start_line, start_column)
+            if token.type is _TT_COMMA:
+                # 内联 _advance（逗号之后必有下一个token）
+                self.position = position = self.position + 1
+                self.current_token = token = tokens[position]
+            elif token.type is not _TT_RIGHT_PAREN:
+                raise SyntaxError(str([token.line, token.column, "值之间需要逗号分隔"]))
+
+        # 当前token已确认是右括号，直接前进
+        self._advance()
+        return row_values
 
     def _parse_truncate(self) -> TruncateTableStatement:
         """解析TRUNCATE TABLE语句"""
-        self._expect(TokenType.TRUNCATE)
-        self._expect(TokenType.TABLE)
-        table_name = self._expect(TokenType.IDENTIFIER).value
+        self._expect(_TT_TRUNCATE)
+        self._expect(_TT_TABLE)
+        table_name = self._expect(_TT_IDENTIFIER).value
         return TruncateTableStatement(table_name)
 
     def _parse_select(self) -> SelectStatement:
         """解析 SELECT 语句
         支持聚合、JOIN、WHERE、GROUP BY、ORDER BY等子句。
         """
-        self._expect(TokenType.SELECT)
+        self._expect(_TT_SELECT)
+
+        # 快速路径：最常见的 SELECT * FROM t [WHERE ...] 形状直接跳过选择列表与JOIN循环
+        tokens = self.tokens
+        position = self.position
+        if (position + 3 < self._token_count
+                and tokens[position].type is _TT_STAR
+                and tokens[position + 1].type is _TT_FROM
+                and tokens[position + 2].type is _TT_IDENTIFIER
+                and tokens[position + 3].type in _SIMPLE_SELECT_TAIL_TOKENS):
+            columns = ["*"]
+            left = tokens[position + 2].value
+            self.position = position + 3
+            self.current_token = tokens[position + 3]
+        else:
+            columns = self._parse_select_columns()
+            left = self._parse_from_clause()
 
-        # 解析选择列表（SELECT后面跟的字段/表达式/聚合函数等）
+        # 解析可选的WHERE子句
+        where_clause = None
+        if self.current_token.type is _TT_WHERE:
+            self._advance()
+            where_clause = self._parse_where_expression()
+
+        # 解析可选的GROUP BY子句，支持多列
+        group_by = []
+        if self.current_token.type is _TT_GROUP_BY:
+            self._advance()  # GROUP BY
+            while True:
+                token = self.current_token
+                if token.type is _TT_IDENTIFIER:
+                    group_by.append(self._parse_qualified_column(keep_pos=False))
+                else:
+                    # GROUP BY分支：遇到非标识符，抛出语法错误
+                    raise SyntaxError(str([token.line, token.column, "GROUP BY 期望列名"]))
+                if self.current_token.type is _TT_COMMA:
+                    self._advance()
+                else:
+                    break
+
+        # 解析可选的ORDER BY子句，支持多列和排序方向
+        order_by = []
+        if self.current_token.type is _TT_ORDER_BY:
+            self._advance()  # ORDER BY
+            while True:
+                # 列名或标识符
+                token = self.current_token
+                if token.type is _TT_IDENTIFIER:
+                    expr = self._parse_qualified_column(keep_pos=False)
+                else:
+                    # ORDER BY分支：遇到非标识符，抛出语法错误
+                    raise SyntaxError(str([token.line, token.column, "ORDER BY 期望列名"]))
+                # 解析排序方向，默认为ASC
+                token = self.current_token
+                direction = _ORDER_DIRECTIONS.get(token.type)
+                if direction is None:
+                    direction = "ASC"
+                else:
+                    self._advance()
+                    token = self.current_token
+                order_by.append(OrderItem(expr, direction))
+                if token.type is _TT_COMMA:
+                    self._advance()
+                else:
+                    break
+
+        # 构造SELECT AST节点，包含所有子句
+        return SelectStatement(columns, left, where_clause, group_by, order_by)
+
+    def _parse_select_columns(self) -> List[Union[str, Expression]]:
+        """解析选择列表（SELECT后面跟的字段/表达式/聚合函数等）"""
         columns = []
         while True:
+            token = self.current_token
             # 修复：优先判断SELECT *，防止*被_parse_expression误判
-            if self.current_token.type == TokenType.STAR:
+            if token.type is _TT_STAR:
                 columns.append("*")
                 self._advance()
             # 如果是聚合函数（如COUNT/SUM等），则特殊处理
-            elif self.current_token.type in (
-                TokenType.COUNT,
-                TokenType.SUM,
-                TokenType.AVG,
-                TokenType.MIN,
-                TokenType.MAX,
-            ):
-                func_type = self.current_token.type
-                line = self.current_token.line
-                column = self.current_token.column
+            elif token.type in _AGGREGATE_TOKENS:
+                func_type = token.type
+                line = token.line
+                column = token.column
                 self._advance()
-                self._expect(TokenType.LEFT_PAREN)
+                self._expect(_TT_LEFT_PAREN)
                 # 支持COUNT(*)
-                if self.current_token.type == TokenType.STAR:
+                if self.current_token.type is _TT_STAR:
                     arg = "*"
                     self._advance()
                 else:
                     # 解析聚合函数参数，可以是表达式
                     arg = self._parse_expression()
-                self._expect(TokenType.RIGHT_PAREN)
+                self._expect(_TT_RIGHT_PAREN)
                 # 构造聚合函数AST节点
                 columns.append(AggregateFunction(func_type.name, arg, line, column))
             else:
                 # 普通列名或带表前缀的列
-                column_name = self._expect(TokenType.IDENTIFIER).value
-                # 记录当前token的位置信息
-                line = self.tokens[self.position - 1].line if self.position > 0 else None
-                column = self.tokens[self.position - 1].column if self.position > 0 else None
-                if self.current_token and self.current_token.type == TokenType.DOT:
-                    self._advance()
-                    table_name = column_name
-                    column_name = self._expect(TokenType.IDENTIFIER).value
-                    columns.append(ColumnRef(column_name, table_name, line, column))
-                else:
-                    columns.append(ColumnRef(column_name, None, line, column))
+                columns.append(self._parse_qualified_column())
 
             # 逗号分隔多个字段，遇到逗号则继续循环，否则跳出
-            if self.current_token.type == TokenType.COMMA:
+            if self.current_token.type is _TT_COMMA:
                 self._advance()
             else:
                 break
+        return columns
 
+    def _parse_from_clause(self) -> Union[str, JoinClause]:
+        """解析FROM子句及其后的JOIN链，返回表名或JoinClause"""
         # 解析FROM子句，获取主表名和可选别名
-        self._expect(TokenType.FROM)
-        from_table_name = self._expect(TokenType.IDENTIFIER).value
+        self._expect(_TT_FROM)
+        from_table_name = self._expect(_TT_IDENTIFIER).value
         from_table_alias = None
-        if self.current_token and self.current_token.type == TokenType.IDENTIFIER:
-            from_table_alias = self._expect(TokenType.IDENTIFIER).value
+        if self.current_token.type is _TT_IDENTIFIER:
+            from_table_alias = self._expect(_TT_IDENTIFIER).value
         # 修复：只传表名字符串，不传元组，别名单独处理
         left = from_table_name
-        # 支持多表JOIN，循环处理所有JOIN子句
-        while self.current_token and self.current_token.type in (
-            TokenType.JOIN,
-            TokenType.INNER,
-            TokenType.LEFT,
-            TokenType.RIGHT,
-        ):
+        # 支持多表JOIN：先把各JOIN子句平铺收集，循环结束后再统一折叠成左深树
+        joins = []
+        joins_append = joins.append
+        token_type = self.current_token.type
+        while token_type in _JOIN_START_TOKENS:
             # 判断JOIN类型
-            if self.current_token.type == TokenType.INNER:
+            if token_type is _TT_INNER:
                 join_type = "INNER"
                 self._advance()
-                self._expect(TokenType.JOIN)
-            elif self.current_token.type == TokenType.LEFT:
+                self._expect(_TT_JOIN)
+            elif token_type is _TT_LEFT:
                 join_type = "LEFT"
                 self._advance()
-                self._expect(TokenType.JOIN)
-            elif self.current_token.type == TokenType.RIGHT:
+                self._expect(_TT_JOIN)
+            elif token_type is _TT_RIGHT:
                 join_type = "RIGHT"
                 self._advance()
-                self._expect(TokenType.JOIN)
+                self._expect(_TT_JOIN)
             else:
                 # 默认JOIN类型为INNER
                 join_type = "INNER"
-                self._expect(TokenType.JOIN)
+                self._expect(_TT_JOIN)
 
             # 解析右表名和可选别名
-            right_table_name = self._expect(TokenType.IDENTIFIER).value
+            right_table_name = self._expect(_TT_IDENTIFIER).value
             right_table_alias = None
-            if self.current_token and self.current_token.type == TokenType.IDENTIFIER:
-                right_table_alias = self._expect(TokenType.IDENTIFIER).value
+            if self.current_token.type is _TT_IDENTIFIER:
+                right_table_alias = self._expect(_TT_IDENTIFIER).value
             # 解析ON条件表达式
-            self._expect(TokenType.ON)
+            self._expect(_TT_ON)
             on_expr = self._parse_where_expression()
-            # 构造JOIN AST节点，left链式连接
-            left = JoinClause(left, right_table_name, join_type, on_expr)
-        # left为最终的from_table（str或JoinClause）
+            joins_append((right_table_name, join_type, on_expr))
+            token_type = self.current_token.type
 
-        # 解析可选的WHERE子句
-        where_clause = None
-        if self.current_token and self.current_token.type == TokenType.WHERE:
-            self._advance()
-            where_clause = self._parse_where_expression()
-
-        # 解析可选的GROUP BY子句，支持多列
-        group_by = []
-        if self.current_token and self.current_token.type == TokenType.GROUP and self._peek_token_type(1) == TokenType.BY:
-            self._advance()  # GROUP
-            self._advance()  # BY
-            while True:
-                if self.current_token.type == TokenType.IDENTIFIER:
-                    name = self._expect(TokenType.IDENTIFIER).value
-                    if self.current_token and self.current_token.type == TokenType.DOT:
-                        self._advance()
-                        table_name = name
-                        col_name = self._expect(TokenType.IDENTIFIER).value
-                        group_by.append(ColumnRef(col_name, table_name))
-                    else:
-                        group_by.append(ColumnRef(name))
-                else:
-                    # GROUP BY分支：遇到非标识符，抛出语法错误
-                    raise SyntaxError(str([self.current_token.line, self.current_token.column, "GROUP BY 期望列名"]))
-                if self.current_token and self.current_token.type == TokenType.COMMA:
-                    self._advance()
-                else:
-                    break
-
-        # 解析可选的ORDER BY子句，支持多列和排序方向
-        order_by = []
-        if self.current_token and self.current_token.type == TokenType.ORDER and self._peek_token_type(1) == TokenType.BY:
-            self._advance()  # ORDER
-            self._advance()  # BY
-            while True:
-                # 列名或标识符
-                if self.current_token.type == TokenType.IDENTIFIER:
-                    name = self._expect(TokenType.IDENTIFIER).value
-                    if self.current_token and self.current_token.type == TokenType.DOT:
-                        self._advance()
-                        table_name = name
-                        col_name = self._expect(TokenType.IDENTIFIER).value
-                        expr = ColumnRef(col_name, table_name)
-                    else:
-                        expr = ColumnRef(name)
-                else:
-                    # ORDER BY分支：遇到非标识符，抛出语法错误
-                    raise SyntaxError(str([self.current_token.line, self.current_token.column, "ORDER BY 期望列名"]))
-                # 解析排序方向，默认为ASC
-                direction = "ASC"
-                if self.current_token and self.current_token.type in (TokenType.ASC, TokenType.DESC):
-                    direction = self.current_token.value.upper()
-                    self._advance()
-                order_by.append(OrderItem(expr, direction))
-                if self.current_token and self.current_token.type == TokenType.COMMA:
-                    self._advance()
-                else:
-                    break
-
-        # 构造SELECT AST节点，包含所有子句
-        return SelectStatement(columns, left, where_clause, group_by, order_by)
+        # 构造JOIN AST节点，left链式连接；left为最终的from_table（str或JoinClause）
+        for right_table_name, join_type, on_expr in joins:
+            left = JoinClause(left, right_table_name, join_type, on_expr)
+        return left
 
     def _parse_where_expression(self) -> Expression:
         """解析 WHERE 表达式（入口）"""
-        return self._parse_or_expression()
-
-    def _parse_or_expression(self) -> Expression:
-        """解析 OR 表达式，左递归"""
-        left = self._parse_and_expression()
-
-        while self.current_token and self.current_token.type == TokenType.OR:
-            operator = self.current_token.value
-            self._advance()
-            right = self._parse_and_expression()
-            left = LogicalOp(left, operator, right)
-
-        return left
-
-    def _parse_and_expression(self) -> Expression:
-        """解析 AND 表达式，左递归"""
-        left = self._parse_comparison_expression()
-
-        while self.current_token and self.current_token.type == TokenType.AND:
-            operator = self.current_token.value
-            self._advance()
-            right = self._parse_comparison_expression()
-            left = LogicalOp(left, operator, right)
+        return self._parse_logical_expression(_OR_PRECEDENCE)
 
-        return left
-
-    def _parse_comparison_expression(self) -> Expression:
-        """解析比较表达式，支持=、!=、<、<=、>、>="""
+    def _parse_logical_expression(self, min_precedence: int) -> Expression:
+        """按优先级循环解析 AND/OR 表达式（AND 高于 OR，均为左结合）
+        每个操作数是一个比较表达式：算术表达式后至多跟一个比较运算，比较运算不可连用。
+        """
         left = self._parse_expression()
+        token = self.current_token
+        if token.type in _COMPARISON_TOKENS:
+            # 内联 _advance（比较运算符之后必有下一个token）
+            self.position = position = self.position + 1
+            self.current_token = self.tokens[position]
+            left = BinaryOp(left, token.value, self._parse_expression())
+            token = self.current_token
 
-        if self.current_token and self.current_token.type in (
-            TokenType.EQUALS,
-            TokenType.LESS_THAN,
-            TokenType.GREATER_THAN,
-            TokenType.LESS_EQUAL,
-            TokenType.GREATER_EQUAL,
-            TokenType.NOT_EQUAL,
-        ):
-            operator = self.current_token.value
-            self._advance()
-            right = self._parse_expression()
-            return BinaryOp(left, operator, right)
+        while True:
+            precedence = _LOGICAL_PRECEDENCE.get(token.type)
+            if precedence is None or precedence < min_precedence:
+                break
+            # 内联 _advance（AND/OR 之后必有下一个token）
+            self.position = position = self.position + 1
+            self.current_token = self.tokens[position]
+            right = self._parse_logical_expression(precedence + 1)
+            left = LogicalOp(left, token.value, right)
+            token = self.current_token
 
         return left
 
     def _parse_expression(self) -> Expression:
         """解析基本表达式，支持列、字面量、NULL、布尔、简单二元算术运算（+ - * /）"""
         left = self._parse_primary()
-        while self.current_token and self.current_token.type in (TokenType.STAR, TokenType.PLUS, TokenType.MINUS, TokenType.SLASH):
-            op_token = self.current_token
-            self._advance()
+        op_token = self.current_token
+        # 绝大多数表达式只有一个基本项，后面没有运算符时直接返回
+        if op_token.type not in _ARITHMETIC_TOKENS:
+            return left
+        while op_token.type in _ARITHMETIC_TOKENS:
+            # 内联 _advance（运算符之后必有下一个token）
+            self.position = position = self.position + 1
+            self.current_token = self.tokens[position]
             right = self._parse_primary()
             left = BinaryOp(left, op_token.value, right)
+            op_token = self.current_token
         return left
 
     def _parse_primary(self) -> Expression:
-        if self.current_token.type == TokenType.IDENTIFIER:
-            column_name = self.current_token.value
-            line = self.current_token.line
-            column = self.current_token.column
-            self._advance()
-            if self.current_token and self.current_token.type == TokenType.DOT:
-                self._advance()
-                table_name = column_name
-                column_name = self._expect(TokenType.IDENTIFIER).value
-                return ColumnRef(column_name, table_name, line, column)
-            else:
-                return ColumnRef(column_name, None, line, column)
-        elif self.current_token.type == TokenType.NUMBER:
-            value = self.current_token.value
-            self._advance()
-            if "." in value:
-                return Literal(float(value), "FLOAT")
-            else:
-                return Literal(int(value), "INTEGER")
-        elif self.current_token.type == TokenType.STRING:
-            value = self.current_token.value.strip("'")
-            self._advance()
-            return Literal(value, "STRING")
-        elif self.current_token.type == TokenType.NULL:
-            self._advance()
-            return Literal(None, "NULL")
-        elif self.current_token.type == TokenType.TRUE:
-            self._advance()
-            return Literal(True, "BOOLEAN")
-        elif self.current_token.type == TokenType.FALSE:
+        """解析基本项：按当前token类型查表分发到对应的处理方法"""
+        token = self.current_token
+        parse_fn = self._PRIMARY_PARSERS.get(token.type)
+        if parse_fn is None:
+            raise SyntaxError(str([token.line, token.column, f"不期望的token: {token.value}"]))
+        return parse_fn(self)
+
+    def _parse_qualified_column(self, keep_pos: bool = True) -> ColumnRef:
+        """解析列引用，支持 column 或 table.column 形式
+        keep_pos 为 True 时记录列名token的行列号（供错误定位）；
+        为 False 时（GROUP BY/ORDER BY）返回驻留的无位置列引用。
+        """
+        token = self._expect(_TT_IDENTIFIER)
+        if self.current_token.type is _TT_DOT:
             self._advance()
-            return Literal(False, "BOOLEAN")
+            table_name = token.value
+            column_name = self._expect(_TT_IDENTIFIER).value
         else:
-            raise SyntaxError(str([self.current_token.line, self.current_token.column, f"不期望的token: {self.current_token.value}"]))
+            table_name = None
+            column_name = token.value
+        if keep_pos:
+            return ColumnRef(column_name, table_name, token.line, token.column)
+        return self._column_ref(column_name, table_name)
+
+    def _parse_number_primary(self) -> Literal:
+        value = self.current_token.value
+        # 内联 _advance（数字之后必有下一个token）
+        self.position = position = self.position + 1
+        self.current_token = self.tokens[position]
+        return _number_literal(value)
+
+    def _parse_string_primary(self) -> Literal:
+        # 词法分析阶段已去掉STRING两端的引号，这里直接使用token文本
+        value = self.current_token.value
+        self._advance()
+        return _string_literal(value)
+
+    def _parse_null_primary(self) -> Literal:
+        self._advance()
+        return _NULL_LITERAL
+
+    def _parse_true_primary(self) -> Literal:
+        self._advance()
+        return _TRUE_LITERAL
 
+    def _parse_false_primary(self) -> Literal:
+        self._advance()
+        return _FALSE_LITERAL
+
+    # 基本项分发表：token类型 -> 解析方法
+    _PRIMARY_PARSERS = {
+        _TT_IDENTIFIER: _parse_qualified_column,
+        _TT_NUMBER: _parse_number_primary,
+        _TT_STRING: _parse_string_primary,
+        _TT_NULL: _parse_null_primary,
+        _TT_TRUE: _parse_true_primary,
+        _TT_FALSE: _parse_false_primary,
+    }
 
-    def _parse_if_exists_flags(self, support_not=True):
+
+    def _parse_if_exists_flags(self, support_not: bool = True) -> Tuple[bool, bool]:
         """辅助解析 IF [NOT] EXISTS，返回 (if_exists, if_not_exists)
         用于CREATE/DROP等语句的可选修饰。
         """
         if_exists = False
         if_not_exists = False
-        if self.current_token and self.current_token.type == TokenType.IF:
+        if self.current_token.type is _TT_IF:
             self._advance()
-            if support_not and self.current_token and self.current_token.type == TokenType.NOT:
+            if support_not and self.current_token.type is _TT_NOT:
                 self._advance()
-                self._expect(TokenType.EXISTS)
+                self._expect(_TT_EXISTS)
                 if_not_exists = True
             else:
-                self._expect(TokenType.EXISTS)
+                self._expect(_TT_EXISTS)
                 if_exists = True
         return if_exists, if_not_exists
 
@@ -597,30 +864,30 @@ class SQLParser:
     #         return wrapper
     #     return decorator
 
-    def _parse_create_table(self, start_line, start_column):
+    def _parse_create_table(self, start_line: int, start_column: int) -> CreateTableStatement:
         # 解析 CREATE TABLE 语句，支持 IF NOT EXISTS
-        self._expect(TokenType.TABLE)
+        self._expect(_TT_TABLE)
         # 在 CREATE TABLE 之后，在表名之前，解析 IF NOT EXISTS
         _, if_not_exists = self._parse_if_exists_flags(support_not=True)
-        table_name = self._expect(TokenType.IDENTIFIER).value
-        self._expect(TokenType.LEFT_PAREN)
+        table_name = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_LEFT_PAREN)
         columns = []
-        while self.current_token.type != TokenType.RIGHT_PAREN:
+        while self.current_token.type is not _TT_RIGHT_PAREN:
             column = self._parse_column_definition()
             columns.append(column)
-            if self.current_token.type == TokenType.COMMA:
+            if self.current_token.type is _TT_COMMA:
                 self._advance()
-            elif self.current_token.type != TokenType.RIGHT_PAREN:
+            elif self.current_token.type is not _TT_RIGHT_PAREN:
                 raise SyntaxError(str([self.current_token.line, self.current_token.column, "列定义之间需要逗号分隔"]))
-        self._expect(TokenType.RIGHT_PAREN)
+        self._expect(_TT_RIGHT_PAREN)
         return CreateTableStatement(table_name, columns, if_not_exists=if_not_exists, line=start_line, column=start_column)
 
-    def _parse_drop_table(self, start_line, start_column):
+    def _parse_drop_table(self, start_line: int, start_column: int) -> DropTableStatement:
         # 解析 DROP TABLE 语句，支持 IF EXISTS
-        self._expect(TokenType.TABLE)
+        self._expect(_TT_TABLE)
         # 在 DROP TABLE 之后，在表名之前，解析 IF EXISTS
         if_exists, _ = self._parse_if_exists_flags(support_not=False)
-        table_name = self._expect(TokenType.IDENTIFIER).value
+        table_name = self._expect(_TT_IDENTIFIER).value
         return DropTableStatement(table_name, if_exists=if_exists, line=start_line, column=start_column)
 
     def _parse_update(self) -> UpdateStatement:
@@ -628,33 +895,33 @@ class SQLParser:
         支持多列赋值和可选WHERE。
         """
         start_line, start_column = self.current_token.line, self.current_token.column
-        self._expect(TokenType.UPDATE)
+        self._expect(_TT_UPDATE)
 
         # 获取表名
-        table_name = self._expect(TokenType.IDENTIFIER).value
+        table_name = self._expect(_TT_IDENTIFIER).value
 
         # 解析SET子句
-        self._expect(TokenType.SET)
+        self._expect(_TT_SET)
         set_clauses = []
 
         while True:
             # 解析 column = value
-            column_name = self._expect(TokenType.IDENTIFIER).value
-            self._expect(TokenType.EQUALS)
+            column_name = self._expect(_TT_IDENTIFIER).value
+            self._expect(_TT_EQUALS)
             value_expr = self._parse_expression()
 
             set_clauses.append({"column": column_name, "value": value_expr})
 
             # 检查是否有更多SET子句
-            if self.current_token.type == TokenType.COMMA:
-                self._expect(TokenType.COMMA)
+            if self.current_token.type is _TT_COMMA:
+                self._expect(_TT_COMMA)
             else:
                 break
 
         # 可选的WHERE子句
         where_clause = None
-        if self.current_token and self.current_token.type == TokenType.WHERE:
-            self._expect(TokenType.WHERE)
+        if self.current_token.type is _TT_WHERE:
+            self._expect(_TT_WHERE)
             where_clause = self._parse_where_expression()  # 使用现有的WHERE解析方法
 
         return UpdateStatement(table_name, set_clauses, where_clause, start_line, start_column)
@@ -664,162 +931,164 @@ class SQLParser:
         支持可选WHERE。
         """
         start_line, start_column = self.current_token.line, self.current_token.column
-        self._expect(TokenType.DELETE)
-        self._expect(TokenType.FROM)
+        self._expect(_TT_DELETE)
+        self._expect(_TT_FROM)
 
         # 获取表名
-        table_name = self._expect(TokenType.IDENTIFIER).value
+        table_name = self._expect(_TT_IDENTIFIER).value
 
         # 可选的WHERE子句
         where_clause = None
-        if self.current_token and self.current_token.type == TokenType.WHERE:
-            self._expect(TokenType.WHERE)
+        if self.current_token.type is _TT_WHERE:
+            self._expect(_TT_WHERE)
             where_clause = self._parse_where_expression()  # 使用现有的WHERE解析方法
 
         return DeleteStatement(table_name, where_clause, start_line, start_column)
 
 
-    def _parse_create_index(self, is_unique: bool = False):
+    def _parse_create_index(self, is_unique: bool = False) -> CreateIndexStatement:
         # 解析 CREATE [UNIQUE] INDEX 语句，支持 IF NOT EXISTS
-        self._expect(TokenType.INDEX)
+        self._expect(_TT_INDEX)
         # 在 CREATE INDEX 之后，在表名之前，解析 IF NOT EXISTS
         _, if_not_exists = self._parse_if_exists_flags(support_not=True)
 
-        index_name = self._expect(TokenType.IDENTIFIER).value
-        self._expect(TokenType.ON)
-        table_name = self._expect(TokenType.IDENTIFIER).value
-        self._expect(TokenType.LEFT_PAREN)
-        column_name = self._expect(TokenType.IDENTIFIER).value
-        self._expect(TokenType.RIGHT_PAREN)
+        index_name = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_ON)
+        table_name = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_LEFT_PAREN)
+        column_name = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_RIGHT_PAREN)
         return CreateIndexStatement(index_name, table_name, column_name, is_unique, if_not_exists=if_not_exists)
 
-    def _parse_drop_index(self):
+    def _parse_drop_index(self) -> DropIndexStatement:
         # 解析 DROP INDEX 语句，支持 IF EXISTS
-        self._expect(TokenType.INDEX)
+        self._expect(_TT_INDEX)
         # 在 DROP INDEX 之后，在表名之前，解析 IF EXISTS
         if_exists, _ = self._parse_if_exists_flags(support_not=False)
-        index_name = self._expect(TokenType.IDENTIFIER).value
+        index_name = self._expect(_TT_IDENTIFIER).value
         return DropIndexStatement(index_name, if_exists=if_exists)
 
 
-    def _parse_create_view(self):
+    def _parse_create_view(self) -> CreateViewStatement:
         # 解析 CREATE VIEW 语句，支持 IF NOT EXISTS
-        self._expect(TokenType.CREATE)
-        self._expect(TokenType.VIEW)
+        self._expect(_TT_CREATE)
+        self._expect(_TT_VIEW)
 
         _, if_not_exists = self._parse_if_exists_flags(support_not=True)
 
-        view_name = self._expect(TokenType.IDENTIFIER).value
-        self._expect(TokenType.AS)
-
-        # 从当前位置开始，收集tokens直到分号或EOF
-        start_pos = self.position
-        while self.current_token and self.current_token.type != TokenType.SEMICOLON and self.current_token.type != TokenType.EOF:
-            self._advance()
-
-        end_pos = self.position
-        definition_tokens = self.tokens[start_pos:end_pos]
+        view_name = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_AS)
 
+        # 从当前位置开始，边前进边收集token文本，直到分号或EOF
         parts = []
-        for token in definition_tokens:
-            if token.type == TokenType.STRING:
+        token = self.current_token
+        while token.type is not _TT_SEMICOLON and token.type is not _TT_EOF:
+            if token.type is _TT_STRING:
                 parts.append("'" + token.value.replace("'", "''") + "'")
             else:
                 parts.append(token.value)
+            self._advance()
+            token = self.current_token
 
         view_definition = " ".join(parts).strip()
         if not view_definition.endswith(';'):
             view_definition += ';'
         return CreateViewStatement(view_name, view_definition, if_not_exists=if_not_exists)
 
-    def _parse_drop_view(self):
+    def _parse_drop_view(self) -> DropViewStatement:
         # 解析 DROP VIEW 语句，支持 IF EXISTS
-        self._expect(TokenType.DROP)
-        self._expect(TokenType.VIEW)
+        self._expect(_TT_DROP)
+        self._expect(_TT_VIEW)
         # 在 DROP VIEW 之后，在表名之前，解析 IF EXISTS
         if_exists, _ = self._parse_if_exists_flags(support_not=False)
-        view_name = self._expect(TokenType.IDENTIFIER).value
+        view_name = self._expect(_TT_IDENTIFIER).value
         return DropViewStatement(view_name, if_exists=if_exists)
 
 
-    def _parse_create_user(self):
+    def _parse_create_user(self) -> CreateUserStatement:
         # 解析 CREATE USER 语句，支持 IF NOT EXISTS
-        self._expect(TokenType.CREATE)
-        self._expect(TokenType.USER)
+        self._expect(_TT_CREATE)
+        self._expect(_TT_USER)
         # 在 CREATE USER 之后，在表名之前，解析 IF NOT EXISTS
         _, if_not_exists = self._parse_if_exists_flags(support_not=True)
-        username = self._expect(TokenType.IDENTIFIER).value
-        self._expect(TokenType.IDENTIFIED)
-        self._expect(TokenType.BY)
-        password = self._expect(TokenType.STRING).value.strip("'")
+        username = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_IDENTIFIED)
+        self._expect(_TT_BY)
+        # 词法分析器已去掉字符串两端的引号，token值即密码原文
+        password = self._expect(_TT_STRING).value
         return CreateUserStatement(username, password, if_not_exists=if_not_exists)
 
-    def _parse_drop_user(self):
+    def _parse_drop_user(self) -> DropUserStatement:
         # 解析 DROP USER 语句，支持 IF EXISTS
-        self._expect(TokenType.DROP)
-        self._expect(TokenType.USER)
+        self._expect(_TT_DROP)
+        self._expect(_TT_USER)
         # 在 DROP USER 之后，在表名之前，解析 IF EXISTS
         if_exists, _ = self._parse_if_exists_flags(support_not=False)
-        username = self._expect(TokenType.IDENTIFIER).value
+        username = self._expect(_TT_IDENTIFIER).value
         return DropUserStatement(username, if_exists=if_exists)
 
     # 在 _parse_create_statement/_parse_drop_statement 里分发到上述方法
-    def _parse_create_statement(self):
+    def _parse_create_statement(self) -> Statement:
         # CREATE分发：TABLE/INDEX
         start_line, start_column = self.current_token.line, self.current_token.column
-        self._expect(TokenType.CREATE)
-        if self.current_token.type == TokenType.UNIQUE:
+        self._expect(_TT_CREATE)
+        if self.current_token.type is _TT_UNIQUE:
             self._advance()
             return self._parse_create_index(is_unique=True)
-        elif self.current_token.type == TokenType.INDEX:
+        elif self.current_token.type is _TT_INDEX:
             return self._parse_create_index(is_unique=False)
-        elif self.current_token.type == TokenType.TABLE:
+        elif self.current_token.type is _TT_TABLE:
             return self._parse_create_table(start_line, start_column)
         else:
             raise SyntaxError(f"期望TABLE或INDEX，但得到{self.current_token.value}")
 
-    def _parse_drop_statement(self):
+    def _parse_drop_statement(self) -> Statement:
         # DROP分发：TABLE/INDEX
-        start_line, start_column = self.current_token.line, self.current_token.column
-        self._expect(TokenType.DROP)
-        if self.current_token.type == TokenType.INDEX:
-            return self._parse_drop_index()
-        elif self.current_token.type == TokenType.TABLE:
-            return self._parse_drop_table(start_line, start_column)
-        else:
-            raise SyntaxError(f"DROP语句支持INDEX或TABLE，但得到 {self.current_token.value}")
+        token = self.current_token
+        start_line, start_column = token.line, token.column
+        self._expect(_TT_DROP)
+        token = self.current_token
+        parse_fn = self._DROP_OBJECT_PARSERS.get(token.type)
+        if parse_fn is None:
+            raise SyntaxError(f"DROP语句支持INDEX或TABLE，但得到 {token.value}")
+        return parse_fn(self, start_line, start_column)
+
+    # DROP TABLE/INDEX 分发表：DROP 之后的token类型 -> 解析方法（参数为 DROP 的起始行列）
+    # DropIndexStatement 不记录位置，DROP INDEX 的表项丢弃起始行列
+    _DROP_OBJECT_PARSERS = {
+        _TT_INDEX: lambda self, start_line, start_column: self._parse_drop_index(),
+        _TT_TABLE: _parse_drop_table,
+    }
+
+    def _parse_privilege(self) -> str:
+        """解析 GRANT/REVOKE 中的权限名，返回大写形式
+        支持 ALL [PRIVILEGES]、SELECT/INSERT 等关键字以及普通标识符。
+        """
+        token_type = self.current_token.type
+        if token_type is _TT_ALL:
+            self._advance()
+            if self.current_token.type is _TT_PRIVILEGES:
+                self._advance()
+            return "ALL"
+        # 修复：支持SELECT、INSERT等关键字作为权限名（直接查表取大写名）
+        privilege = _PRIVILEGE_NAMES.get(token_type)
+        if privilege is not None:
+            self._advance()
+            return privilege
+        return self._expect(_TT_IDENTIFIER).value.upper()
 
     def _parse_grant(self) -> GrantStatement:
         """解析 GRANT 语句
         支持ALL/SELECT/INSERT等权限关键字。
         """
-        self._expect(TokenType.GRANT)
+        self._expect(_TT_GRANT)
 
-        # 解析权限类型 - 修复：支持关键字作为权限名
-        if self.current_token.type == TokenType.ALL:
-            privilege = "ALL"
-            self._advance()
-            if self.current_token.type == TokenType.PRIVILEGES:
-                self._advance()
-        else:
-            # 修复：支持SELECT、INSERT等关键字作为权限名
-            if self.current_token.type in (
-                TokenType.SELECT,
-                TokenType.INSERT,
-                TokenType.UPDATE,
-                TokenType.DELETE,
-                TokenType.CREATE,
-                TokenType.DROP,
-            ):
-                privilege = self.current_token.value.upper()
-                self._advance()
-            else:
-                privilege = self._expect(TokenType.IDENTIFIER).value.upper()
+        privilege = self._parse_privilege()
 
-        self._expect(TokenType.ON)
-        table_name = self._expect(TokenType.IDENTIFIER).value
-        self._expect(TokenType.TO)
-        username = self._expect(TokenType.IDENTIFIER).value
+        self._expect(_TT_ON)
+        table_name = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_TO)
+        username = self._expect(_TT_IDENTIFIER).value
 
         return GrantStatement(privilege, table_name, username)
 
@@ -827,102 +1096,78 @@ class SQLParser:
         """解析 REVOKE 语句
         支持ALL/SELECT/INSERT等权限关键字。
         """
-        self._expect(TokenType.REVOKE)
+        self._expect(_TT_REVOKE)
 
-        # 解析权限类型 - 修复：支持关键字作为权限名
-        if self.current_token.type == TokenType.ALL:
-            privilege = "ALL"
-            self._advance()
-            if self.current_token.type == TokenType.PRIVILEGES:
-                self._advance()
-        else:
-            # 修复：支持SELECT、INSERT等关键字作为权限名
-            if self.current_token.type in (
-                TokenType.SELECT,
-                TokenType.INSERT,
-                TokenType.UPDATE,
-                TokenType.DELETE,
-                TokenType.CREATE,
-                TokenType.DROP,
-            ):
-                privilege = self.current_token.value.upper()
-                self._advance()
-            else:
-                privilege = self._expect(TokenType.IDENTIFIER).value.upper()
+        privilege = self._parse_privilege()
 
-        self._expect(TokenType.ON)
-        table_name = self._expect(TokenType.IDENTIFIER).value
-        self._expect(TokenType.FROM)
-        username = self._expect(TokenType.IDENTIFIER).value
+        self._expect(_TT_ON)
+        table_name = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_FROM)
+        username = self._expect(_TT_IDENTIFIER).value
 
         return RevokeStatement(privilege, table_name, username)
 
     def _parse_begin(self) -> Statement:
         # 解析 BEGIN [TRANSACTION] 事务开始
-        self._expect(TokenType.BEGIN)
-        if self.current_token and self.current_token.type == TokenType.TRANSACTION:
+        self._expect(_TT_BEGIN)
+        if self.current_token.type is _TT_TRANSACTION:
             self._advance()
         return BeginTransaction()
 
     def _parse_start_transaction(self) -> Statement:
         # 解析 START TRANSACTION 事务开始
-        self._expect(TokenType.START)
-        self._expect(TokenType.TRANSACTION)
+        self._expect(_TT_START)
+        self._expect(_TT_TRANSACTION)
         return BeginTransaction()
 
     def _parse_commit(self) -> Statement:
         # 解析 COMMIT 事务提交
-        self._expect(TokenType.COMMIT)
+        self._expect(_TT_COMMIT)
         return CommitTransaction()
 
     def _parse_rollback(self) -> Statement:
         # 解析 ROLLBACK 事务回滚
-        self._expect(TokenType.ROLLBACK)
+        self._expect(_TT_ROLLBACK)
         return RollbackTransaction()
 
     def _parse_set(self) -> Statement:
         """解析 SET 语句
         支持 SET AUTOCOMMIT=0|1 和 SET SESSION TRANSACTION ISOLATION LEVEL ...
         """
-        self._expect(TokenType.SET)
+        self._expect(_TT_SET)
         # 两种形式： SET AUTOCOMMIT=0|1 或 SET SESSION TRANSACTION ISOLATION LEVEL ...
-        if self.current_token.type == TokenType.AUTOCOMMIT:
+        token_type = self.current_token.type
+        if token_type is _TT_AUTOCOMMIT:
             self._advance()
-            self._expect(TokenType.EQUALS)
-            if self.current_token.type == TokenType.NUMBER and self.current_token.value in ("0", "1"):
-                enabled = self.current_token.value == "1"
+            self._expect(_TT_EQUALS)
+            token = self.current_token
+            if token.type is _TT_NUMBER and token.value in ("0", "1"):
+                enabled = token.value == "1"
                 self._advance()
                 return SetAutocommit(enabled)
             else:
                 # AUTOCOMMIT分支：只允许0或1，其他值报错
                 raise SyntaxError("AUTOCOMMIT 只能为 0 或 1")
-        elif self.current_token.type == TokenType.SESSION:
+        elif token_type is _TT_SESSION:
             self._advance()
-            self._expect(TokenType.TRANSACTION)
-            self._expect(TokenType.ISOLATION)
-            self._expect(TokenType.LEVEL)
-            # 解析隔离级别
-            if self.current_token.type == TokenType.READ:
-                self._advance()
-                if self.current_token.type == TokenType.COMMITTED_KW:
-                    self._advance()
-                    return SetIsolationLevel("READ COMMITTED")
-                elif self.current_token.type == TokenType.UNCOMMITTED_KW:
+            self._expect_seq(_TT_TRANSACTION, _TT_ISOLATION, _TT_LEVEL)
+            # 解析隔离级别：先按单个关键字查表，再按两个关键字查表
+            first = self.current_token.type
+            key = (first,)
+            level = _ISOLATION_LEVELS.get(key)
+            if level is None and first is not _TT_EOF:
+                key = (first, self._peek_token_type())
+                level = _ISOLATION_LEVELS.get(key)
+            if level is None:
+                if first is _TT_REPEATABLE:
+                    # REPEATABLE 后必须是 READ，由 _expect 给出带行列号的错误
                     self._advance()
-                    return SetIsolationLevel("READ UNCOMMITTED")
-                else:
-                    # READ分支：未知的READ隔离级别
-                    raise SyntaxError("未知的隔离级别: READ ...")
-            elif self.current_token.type == TokenType.REPEATABLE:
-                self._advance()
-                self._expect(TokenType.READ)
-                return SetIsolationLevel("REPEATABLE READ")
-            elif self.current_token.type == TokenType.SERIALIZABLE:
+                    self._expect(_TT_READ)
+                # READ 后跟未知关键字，或完全未知的隔离级别
+                raise SyntaxError("未知的隔离级别: READ ..." if first is _TT_READ else "未知的隔离级别")
+            for _ in key:
                 self._advance()
-                return SetIsolationLevel("SERIALIZABLE")
-            else:
-                # SESSION分支：未知的隔离级别
-                raise SyntaxError("未知的隔离级别")
+            return SetIsolationLevel(level)
         else:
             # SET分支：仅支持AUTOCOMMIT和SESSION
             raise SyntaxError("仅支持: SET AUTOCOMMIT 或 SET SESSION TRANSACTION ISOLATION LEVEL ...")
@@ -931,124 +1176,170 @@ class SQLParser:
         """解析 CREATE TRIGGER 语句
         支持 BEFORE/AFTER, INSERT/UPDATE/DELETE, FOR EACH ROW, 触发器体。
         """
-        self._expect(TokenType.CREATE)
-        self._expect(TokenType.TRIGGER)
+        self._expect(_TT_CREATE)
+        self._expect(_TT_TRIGGER)
 
         # 触发器名称
-        trigger_name = self._expect(TokenType.IDENTIFIER).value
+        trigger_name = self._expect(_TT_IDENTIFIER).value
 
         # 时机: BEFORE 或 AFTER
-        if self.current_token.type not in (TokenType.BEFORE, TokenType.AFTER):
-            raise SyntaxError(f"期望 BEFORE 或 AFTER，但得到 {self.current_token.value}")
-        timing = self.current_token.value
+        token = self.current_token
+        if token.type not in _TRIGGER_TIMING_TOKENS:
+            raise SyntaxError(f"期望 BEFORE 或 AFTER，但得到 {token.value}")
+        timing = token.value
         self._advance()
 
         # 事件: INSERT, UPDATE, DELETE
-        if self.current_token.type not in (TokenType.INSERT, TokenType.UPDATE, TokenType.DELETE):
-            raise SyntaxError(f"期望 INSERT, UPDATE 或 DELETE，但得到 {self.current_token.value}")
-        event = self.current_token.value
+        token = self.current_token
+        if token.type not in _TRIGGER_EVENT_TOKENS:
+            raise SyntaxError(f"期望 INSERT, UPDATE 或 DELETE，但得到 {token.value}")
+        event = token.value
         self._advance()
 
         # ON 关键字
-        self._expect(TokenType.ON)
+        self._expect(_TT_ON)
 
         # 表名
-        table_name = self._expect(TokenType.IDENTIFIER).value
+        table_name = self._expect(_TT_IDENTIFIER).value
 
         # FOR EACH ROW
-        self._expect(TokenType.FOR)
-        self._expect(TokenType.EACH)
-        self._expect(TokenType.ROW)
-
-        # 触发器体（简化为单个SQL语句字符串）
-        statement_tokens = []
-        while (self.current_token and
-               self.current_token.type != TokenType.SEMICOLON and
-               self.current_token.type != TokenType.EOF):
-            # 对于字符串类型的token，需要重新添加引号并转义内部引号
-            if self.current_token.type == TokenType.STRING:
-                # 转义字符串中的单引号
-                escaped_value = self.current_token.value.replace("'", "''")
-                statement_tokens.append(f"'{escaped_value}'")
-            else:
-                statement_tokens.append(self.current_token.value)
-            self._advance()
-
-        if not statement_tokens:
+        self._expect_seq(_TT_FOR, _TT_EACH, _TT_ROW)
+
+        # 触发器体（简化为单个SQL语句字符串）：先只移动下标找到分号/EOF，再对切片统一拼接
+        tokens = self.tokens
+        start = end = self.position
+        while (end < self._token_count and
+               tokens[end].type is not _TT_SEMICOLON and
+               tokens[end].type is not _TT_EOF):
+            end += 1
+        if end == start:
             raise SyntaxError("触发器体不能为空")
-
-        statement = " ".join(statement_tokens)
+        self.position = min(end, self._token_count - 1)
+        self.current_token = tokens[self.position]
+
+        # 对于字符串类型的token，需要重新添加引号并转义内部单引号
+        statement = " ".join([
+            "'" + token.value.replace("'", "''") + "'" if token.type is _TT_STRING else token.value
+            for token in tokens[start:end]
+        ])
         if not statement.endswith(';'):
             statement += ';'
         return CreateTriggerStatement(trigger_name, timing, event, table_name, statement)
 
     def _parse_drop_trigger(self) -> DropTriggerStatement:
         # 解析 DROP TRIGGER 语句，支持 IF EXISTS
-        self._expect(TokenType.DROP)
-        self._expect(TokenType.TRIGGER)
+        self._expect(_TT_DROP)
+        self._expect(_TT_TRIGGER)
 
         # 检查 IF EXISTS
         if_exists = False
-        if (self.current_token and self.current_token.type == TokenType.IF):
+        if self.current_token.type is _TT_IF:
             self._advance()
-            self._expect(TokenType.EXISTS)
+            self._expect(_TT_EXISTS)
             if_exists = True
 
         # 触发器名称
-        trigger_name = self._expect(TokenType.IDENTIFIER).value
+        trigger_name = self._expect(_TT_IDENTIFIER).value
 
         return DropTriggerStatement(trigger_name, if_exists)
 
-    def _parse_alter_table(self):
+    def _dispatch_create(self) -> Statement:
+        # 按CREATE后的token查表：USER/VIEW/TRIGGER各有专门方法，其他统一处理TABLE/INDEX等
+        parse_fn = self._CREATE_PARSERS.get(self._peek_token_type(), SQLParser._parse_create_statement)
+        return parse_fn(self)
+
+    def _dispatch_drop(self) -> Statement:
+        # 按DROP后的token查表：USER/VIEW/TRIGGER各有专门方法，其他统一处理TABLE/INDEX等
+        parse_fn = self._DROP_PARSERS.get(self._peek_token_type(), SQLParser._parse_drop_statement)
+        return parse_fn(self)
+
+    # CREATE/DROP 二级分发表：CREATE/DROP 之后的token类型 -> 解析方法
+    _CREATE_PARSERS = {
+        _TT_USER: _parse_create_user,
+        _TT_VIEW: _parse_create_view,
+        _TT_TRIGGER: _parse_create_trigger,
+    }
+    _DROP_PARSERS = {
+        _TT_USER: _parse_drop_user,
+        _TT_VIEW: _parse_drop_view,
+        _TT_TRIGGER: _parse_drop_trigger,
+    }
+
+    def _parse_alter_table(self) -> AlterTableStatement:
         # 解析 ALTER TABLE 语句，支持 ADD COLUMN/DROP COLUMN
-        self._expect(TokenType.ALTER)
-        self._expect(TokenType.TABLE)
-        table_name = self._expect(TokenType.IDENTIFIER).value
-        if self.current_token.type == TokenType.ADD:
+        self._expect(_TT_ALTER)
+        self._expect(_TT_TABLE)
+        table_name = self._expect(_TT_IDENTIFIER).value
+        token = self.current_token
+        if token.type is _TT_ADD:
             self._advance()
-            self._expect(TokenType.COLUMN)
+            self._expect(_TT_COLUMN)
             col_def = self._parse_column_definition()
             return AlterTableStatement(table_name, 'ADD', column_def=col_def)
-        elif self.current_token.type == TokenType.DROP:
+        elif token.type is _TT_DROP:
             self._advance()
-            self._expect(TokenType.COLUMN)
-            col_name = self._expect(TokenType.IDENTIFIER).value
+            self._expect(_TT_COLUMN)
+            col_name = self._expect(_TT_IDENTIFIER).value
             return AlterTableStatement(table_name, 'DROP', column_name=col_name)
         else:
-            raise SyntaxError(f"ALTER TABLE 仅支持 ADD COLUMN 或 DROP COLUMN, 得到 {self.current_token.value}")
+            raise SyntaxError(f"ALTER TABLE 仅支持 ADD COLUMN 或 DROP COLUMN, 得到 {token.value}")
 
     def _parse_show(self) -> ShowStatement:
         # 解析 SHOW AUTOCOMMIT/SHOW ISOLATION LEVEL
-        self._expect(TokenType.SHOW)
+        self._expect(_TT_SHOW)
 
-        if self.current_token.type == TokenType.AUTOCOMMIT:
+        token_type = self.current_token.type
+        if token_type is _TT_AUTOCOMMIT:
             self._advance()
             return ShowStatement("AUTOCOMMIT")
-        elif self.current_token.type == TokenType.ISOLATION:
+        elif token_type is _TT_ISOLATION:
             self._advance()
-            self._expect(TokenType.LEVEL)
+            self._expect(_TT_LEVEL)
             return ShowStatement("ISOLATION_LEVEL")
         else:
             raise SyntaxError("仅支持: SHOW AUTOCOMMIT 或 SHOW ISOLATION LEVEL")
 
-    def _parse_open_cursor(self):
-        self._expect(TokenType.OPEN)
-        self._expect(TokenType.CURSOR)
-        cursor_name = self._expect(TokenType.IDENTIFIER).value
-        self._expect(TokenType.FOR)
+    def _parse_open_cursor(self) -> OpenCursorStatement:
+        self._expect(_TT_OPEN)
+        self._expect(_TT_CURSOR)
+        cursor_name = self._expect(_TT_IDENTIFIER).value
+        self._expect(_TT_FOR)
         # 允许FOR后嵌套SELECT语句
         select_stmt = self._parse_select()
         return OpenCursorStatement(cursor_name, select_stmt)
 
-    def _parse_fetch_cursor(self):
-        self._expect(TokenType.FETCH)
-        count = int(self._expect(TokenType.NUMBER).value)
-        self._expect(TokenType.FROM)
-        cursor_name = self._expect(TokenType.IDENTIFIER).value
+    def _parse_fetch_cursor(self) -> FetchCursorStatement:
+        self._expect(_TT_FETCH)
+        count = int(self._expect(_TT_NUMBER).value)
+        self._expect(_TT_FROM)
+        cursor_name = self._expect(_TT_IDENTIFIER).value
         return FetchCursorStatement(count, cursor_name)
 
-    def _parse_close_cursor(self):
-        self._expect(TokenType.CLOSE)
-        self._expect(TokenType.CURSOR)
-        cursor_name = self._expect(TokenType.IDENTIFIER).value
+    def _parse_close_cursor(self) -> CloseCursorStatement:
+        self._expect(_TT_CLOSE)
+        self._expect(_TT_CURSOR)
+        cursor_name = self._expect(_TT_IDENTIFIER).value
         return CloseCursorStatement(cursor_name)
+
+    # 语句分发表：首token类型 -> 解析方法
+    _STATEMENT_PARSERS = {
+        _TT_CREATE: _dispatch_create,
+        _TT_DROP: _dispatch_drop,
+        _TT_GRANT: _parse_grant,
+        _TT_REVOKE: _parse_revoke,
+        _TT_INSERT: _parse_insert,
+        _TT_SELECT: _parse_select,
+        _TT_UPDATE: _parse_update,
+        _TT_DELETE: _parse_delete,
+        _TT_BEGIN: _parse_begin,
+        _TT_START: _parse_start_transaction,
+        _TT_COMMIT: _parse_commit,
+        _TT_ROLLBACK: _parse_rollback,
+        _TT_SET: _parse_set,
+        _TT_TRUNCATE: _parse_truncate,
+        _TT_ALTER: _parse_alter_table,
+        _TT_SHOW: _parse_show,
+        _TT_OPEN: _parse_open_cursor,
+        _TT_FETCH: _parse_fetch_cursor,
+        _TT_CLOSE: _parse_close_cursor,
+    }
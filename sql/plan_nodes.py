@@ -4,40 +4,92 @@
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Union
 from .ast_nodes import Expression
 
 
+@lru_cache(maxsize=64)
+def _indent(level: int) -> str:
+    """树形输出的缩进前缀，同一层级的前缀字符串只构造一次"""
+    return "  " * level
+
+
 class PlanNode(ABC):
     """执行计划节点基类"""
 
+    __slots__ = ("output_schema", "estimated_rows", "estimated_cost", "children")
+
     def __init__(self):
         self.output_schema: List[str] = []  # 输出列名
         self.estimated_rows: int = 0
         self.estimated_cost: float = 0.0
         self.children: List['PlanNode'] = []
 
-    @abstractmethod
+    # to_dict/to_tree_string 是否输出子节点（扫描、插入、建表等叶子节点不输出）
+    _shows_children = True
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
-        pass
+        return plan_to_dict(self)
 
     @abstractmethod
+    def _to_dict_shallow(self) -> Dict[str, Any]:
+        """只转换本节点自身的字段，children 由 plan_to_dict 统一填充"""
+        pass
+
     def to_tree_string(self, indent: int = 0) -> str:
-        """转换为树形字符串"""
+        """转换为树形字符串
+        先序遍历整棵树，各节点把自己的行追加到同一个列表，最后一次性拼接。
+        """
+        buf: List[str] = []
+        stack = [(self, indent)]
+        while stack:
+            node, level = stack.pop()
+            node._emit(buf, _indent(level))
+            if node._shows_children:
+                stack.extend((child, level + 1) for child in reversed(node.children))
+        return "".join(buf)
+
+    @abstractmethod
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        """把本节点自身的行追加到 buf，子节点由 to_tree_string 统一处理"""
         pass
 
 
+def plan_to_dict(root: PlanNode) -> Dict[str, Any]:
+    """把执行计划树转换为嵌套字典
+    用显式栈做后序遍历：子节点先转换好，父节点再按顺序取用，避免逐层递归调用 to_dict。
+    """
+    converted: Dict[int, Dict[str, Any]] = {}
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children)
+            continue
+        result = node._to_dict_shallow()
+        if node._shows_children:
+            result["children"] = [converted[id(child)] for child in node.children]
+        converted[id(node)] = result
+    return converted[id(root)]
+
+
 class SeqScanNode(PlanNode):
     """顺序扫描节点"""
 
+    __slots__ = ("table_name", "filter_condition")
+    node_type = "SeqScan"
+
+    _shows_children = False
+
     def __init__(self, table_name: str, filter_condition: Optional[Expression] = None):
         super().__init__()
         self.table_name = table_name
         self.filter_condition = filter_condition
-        self.node_type = "SeqScan"
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "table_name": self.table_name,
@@ -47,27 +99,29 @@ class SeqScanNode(PlanNode):
             "output_schema": self.output_schema
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}SeqScan on {self.table_name}\n"
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}SeqScan on {self.table_name}\n")
         if self.filter_condition:
-            result += f"{prefix}  Filter: {self.filter_condition}\n"
-        result += f"{prefix}  Estimated rows: {self.estimated_rows}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        return result
+            buf.append(f"{prefix}  Filter: {self.filter_condition}\n")
+        buf.append(f"{prefix}  Estimated rows: {self.estimated_rows}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class IndexScanNode(PlanNode):
     """索引扫描节点"""
 
+    __slots__ = ("table_name", "index_name", "scan_condition")
+    node_type = "IndexScan"
+
+    _shows_children = False
+
     def __init__(self, table_name: str, index_name: str, scan_condition: Expression):
         super().__init__()
         self.table_name = table_name
         self.index_name = index_name
         self.scan_condition = scan_condition
-        self.node_type = "IndexScan"
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "table_name": self.table_name,
@@ -78,54 +132,51 @@ class IndexScanNode(PlanNode):
             "output_schema": self.output_schema
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}IndexScan on {self.table_name} using {self.index_name}\n"
-        result += f"{prefix}  Index condition: {self.scan_condition}\n"
-        result += f"{prefix}  Estimated rows: {self.estimated_rows}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        return result
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}IndexScan on {self.table_name} using {self.index_name}\n")
+        buf.append(f"{prefix}  Index condition: {self.scan_condition}\n")
+        buf.append(f"{prefix}  Estimated rows: {self.estimated_rows}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class FilterNode(PlanNode):
     """过滤节点"""
 
+    __slots__ = ("condition",)
+    node_type = "Filter"
+
     def __init__(self, child: PlanNode, condition: Expression):
         super().__init__()
         self.children = [child]
         self.condition = condition
-        self.node_type = "Filter"
         self.output_schema = child.output_schema
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "condition": str(self.condition),
             "estimated_rows": self.estimated_rows,
             "estimated_cost": self.estimated_cost,
-            "output_schema": self.output_schema,
-            "children": [child.to_dict() for child in self.children]
+            "output_schema": self.output_schema
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}Filter\n"
-        result += f"{prefix}  Condition: {self.condition}\n"
-        result += f"{prefix}  Estimated rows: {self.estimated_rows}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        for child in self.children:
-            result += child.to_tree_string(indent + 1)
-        return result
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}Filter\n")
+        buf.append(f"{prefix}  Condition: {self.condition}\n")
+        buf.append(f"{prefix}  Estimated rows: {self.estimated_rows}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class ProjectNode(PlanNode):
     """投影节点"""
 
+    __slots__ = ("select_list",)
+    node_type = "Project"
+
     def __init__(self, child: PlanNode, select_list: List[Union[str, Expression]]):
         super().__init__()
         self.children = [child]
         self.select_list = select_list
-        self.node_type = "Project"
         # 构建输出模式
         self.output_schema = []
         for item in select_list:
@@ -134,145 +185,136 @@ class ProjectNode(PlanNode):
             else:
                 self.output_schema.append(str(item))
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "select_list": [str(item) for item in self.select_list],
             "estimated_rows": self.estimated_rows,
             "estimated_cost": self.estimated_cost,
-            "output_schema": self.output_schema,
-            "children": [child.to_dict() for child in self.children]
+            "output_schema": self.output_schema
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}Project\n"
-        result += f"{prefix}  Select list: {[str(item) for item in self.select_list]}\n"
-        result += f"{prefix}  Estimated rows: {self.estimated_rows}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        for child in self.children:
-            result += child.to_tree_string(indent + 1)
-        return result
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}Project\n")
+        buf.append(f"{prefix}  Select list: {[str(item) for item in self.select_list]}\n")
+        buf.append(f"{prefix}  Estimated rows: {self.estimated_rows}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class JoinNode(PlanNode):
     """连接节点"""
 
+    __slots__ = ("join_type", "join_condition")
+    node_type = "Join"
+
     def __init__(self, left_child: PlanNode, right_child: PlanNode,
                  join_type: str, join_condition: Expression):
         super().__init__()
         self.children = [left_child, right_child]
         self.join_type = join_type
         self.join_condition = join_condition
-        self.node_type = "Join"
         # 合并输出模式
         self.output_schema = left_child.output_schema + right_child.output_schema
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "join_type": self.join_type,
             "join_condition": str(self.join_condition),
             "estimated_rows": self.estimated_rows,
             "estimated_cost": self.estimated_cost,
-            "output_schema": self.output_schema,
-            "children": [child.to_dict() for child in self.children]
+            "output_schema": self.output_schema
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}{self.join_type} Join\n"
-        result += f"{prefix}  Join condition: {self.join_condition}\n"
-        result += f"{prefix}  Estimated rows: {self.estimated_rows}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        for child in self.children:
-            result += child.to_tree_string(indent + 1)
-        return result
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}{self.join_type} Join\n")
+        buf.append(f"{prefix}  Join condition: {self.join_condition}\n")
+        buf.append(f"{prefix}  Estimated rows: {self.estimated_rows}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class SortNode(PlanNode):
     """排序节点"""
 
+    __slots__ = ("order_by",)
+    node_type = "Sort"
+
     def __init__(self, child: PlanNode, order_by: List[Dict[str, Any]]):
         super().__init__()
         self.children = [child]
         self.order_by = order_by
-        self.node_type = "Sort"
         self.output_schema = child.output_schema
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "order_by": self.order_by,
             "estimated_rows": self.estimated_rows,
             "estimated_cost": self.estimated_cost,
-            "output_schema": self.output_schema,
-            "children": [child.to_dict() for child in self.children]
+            "output_schema": self.output_schema
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}Sort\n"
-        result += f"{prefix}  Order by: {self.order_by}\n"
-        result += f"{prefix}  Estimated rows: {self.estimated_rows}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        for child in self.children:
-            result += child.to_tree_string(indent + 1)
-        return result
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}Sort\n")
+        buf.append(f"{prefix}  Order by: {self.order_by}\n")
+        buf.append(f"{prefix}  Estimated rows: {self.estimated_rows}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class AggregateNode(PlanNode):
     """聚合节点"""
 
+    __slots__ = ("group_by", "aggregate_functions")
+    node_type = "Aggregate"
+
     def __init__(self, child: PlanNode, group_by: List[str] = None,
                  aggregate_functions: List[Dict[str, Any]] = None):
         super().__init__()
         self.children = [child]
         self.group_by = group_by or []
         self.aggregate_functions = aggregate_functions or []
-        self.node_type = "Aggregate"
-        # 构建输出模式
-        self.output_schema = self.group_by.copy()
-        for agg in self.aggregate_functions:
-            self.output_schema.append(agg.get("alias", f"{agg['function']}({agg['column']})"))
+        # 构建输出模式：有 alias 键时直接用别名，否则才拼接 "函数(列)"
+        self.output_schema = self.group_by + [
+            agg["alias"] if "alias" in agg else f"{agg['function']}({agg['column']})"
+            for agg in self.aggregate_functions
+        ]
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "group_by": self.group_by,
             "aggregate_functions": self.aggregate_functions,
             "estimated_rows": self.estimated_rows,
             "estimated_cost": self.estimated_cost,
-            "output_schema": self.output_schema,
-            "children": [child.to_dict() for child in self.children]
+            "output_schema": self.output_schema
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}Aggregate\n"
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}Aggregate\n")
         if self.group_by:
-            result += f"{prefix}  Group by: {self.group_by}\n"
+            buf.append(f"{prefix}  Group by: {self.group_by}\n")
         if self.aggregate_functions:
-            result += f"{prefix}  Aggregates: {self.aggregate_functions}\n"
-        result += f"{prefix}  Estimated rows: {self.estimated_rows}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        for child in self.children:
-            result += child.to_tree_string(indent + 1)
-        return result
+            buf.append(f"{prefix}  Aggregates: {self.aggregate_functions}\n")
+        buf.append(f"{prefix}  Estimated rows: {self.estimated_rows}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class InsertNode(PlanNode):
     """插入节点"""
 
+    __slots__ = ("table_name", "columns", "values")
+    node_type = "Insert"
+
+    _shows_children = False
+
     def __init__(self, table_name: str, columns: List[str], values: List[List[Any]]):
         super().__init__()
         self.table_name = table_name
         self.columns = columns
         self.values = values
-        self.node_type = "Insert"
         self.estimated_rows = len(values)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "table_name": self.table_name,
@@ -282,18 +324,19 @@ class InsertNode(PlanNode):
             "estimated_cost": self.estimated_cost
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}Insert into {self.table_name}\n"
-        result += f"{prefix}  Columns: {self.columns}\n"
-        result += f"{prefix}  Values count: {len(self.values)}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        return result
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}Insert into {self.table_name}\n")
+        buf.append(f"{prefix}  Columns: {self.columns}\n")
+        buf.append(f"{prefix}  Values count: {len(self.values)}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class UpdateNode(PlanNode):
     """更新节点"""
 
+    __slots__ = ("table_name", "set_clauses")
+    node_type = "Update"
+
     def __init__(self, table_name: str, set_clauses: List[Dict[str, Any]],
                  child: Optional[PlanNode] = None):
         super().__init__()
@@ -301,68 +344,63 @@ class UpdateNode(PlanNode):
         self.set_clauses = set_clauses
         if child:
             self.children = [child]
-        self.node_type = "Update"
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "table_name": self.table_name,
             "set_clauses": self.set_clauses,
             "estimated_rows": self.estimated_rows,
-            "estimated_cost": self.estimated_cost,
-            "children": [child.to_dict() for child in self.children]
+            "estimated_cost": self.estimated_cost
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}Update {self.table_name}\n"
-        result += f"{prefix}  Set: {self.set_clauses}\n"
-        result += f"{prefix}  Estimated rows: {self.estimated_rows}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        for child in self.children:
-            result += child.to_tree_string(indent + 1)
-        return result
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}Update {self.table_name}\n")
+        buf.append(f"{prefix}  Set: {self.set_clauses}\n")
+        buf.append(f"{prefix}  Estimated rows: {self.estimated_rows}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class DeleteNode(PlanNode):
     """删除节点"""
 
+    __slots__ = ("table_name",)
+    node_type = "Delete"
+
     def __init__(self, table_name: str, child: Optional[PlanNode] = None):
         super().__init__()
         self.table_name = table_name
         if child:
             self.children = [child]
-        self.node_type = "Delete"
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "table_name": self.table_name,
             "estimated_rows": self.estimated_rows,
-            "estimated_cost": self.estimated_cost,
-            "children": [child.to_dict() for child in self.children]
+            "estimated_cost": self.estimated_cost
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}Delete from {self.table_name}\n"
-        result += f"{prefix}  Estimated rows: {self.estimated_rows}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        for child in self.children:
-            result += child.to_tree_string(indent + 1)
-        return result
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}Delete from {self.table_name}\n")
+        buf.append(f"{prefix}  Estimated rows: {self.estimated_rows}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
 
 
 class CreateTableNode(PlanNode):
     """建表节点"""
 
+    __slots__ = ("table_name", "columns")
+    node_type = "CreateTable"
+
+    _shows_children = False
+
     def __init__(self, table_name: str, columns: List[Dict[str, Any]]):
         super().__init__()
         self.table_name = table_name
         self.columns = columns
-        self.node_type = "CreateTable"
 
-    def to_dict(self) -> Dict[str, Any]:
+    def _to_dict_shallow(self) -> Dict[str, Any]:
         return {
             "node_type": self.node_type,
             "table_name": self.table_name,
@@ -370,9 +408,7 @@ class CreateTableNode(PlanNode):
             "estimated_cost": self.estimated_cost
         }
 
-    def to_tree_string(self, indent: int = 0) -> str:
-        prefix = "  " * indent
-        result = f"{prefix}Create Table {self.table_name}\n"
-        result += f"{prefix}  Columns: {len(self.columns)}\n"
-        result += f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n"
-        return result
+    def _emit(self, buf: List[str], prefix: str) -> None:
+        buf.append(f"{prefix}Create Table {self.table_name}\n")
+        buf.append(f"{prefix}  Columns: {len(self.columns)}\n")
+        buf.append(f"{prefix}  Estimated cost: {self.estimated_cost:.2f}\n")
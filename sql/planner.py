@@ -3,6 +3,7 @@
 """
 
 import json
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Union
 from .ast_nodes import *
 from .plan_nodes import *
@@ -338,6 +339,14 @@ class CostModel:
         node.estimated_cost = len(node.columns) * 0.1  # 建表成本较低
 
 
+@lru_cache(maxsize=8)
+def _plan_json_encoder(indent: int) -> json.JSONEncoder:
+    """按缩进缓存JSON编码器，避免每次 format_as_json 都重新构造
+    执行计划是树，不会出现循环引用，因此关闭循环检查。
+    """
+    return json.JSONEncoder(indent=indent, ensure_ascii=False, check_circular=False)
+
+
 class PlanFormatter:
     """执行计划格式化器"""
 
@@ -349,7 +358,7 @@ class PlanFormatter:
     @staticmethod
     def format_as_json(plan: PlanNode, indent: int = 2) -> str:
         """格式化为JSON字符串"""
-        return json.dumps(plan.to_dict(), indent=indent, ensure_ascii=False)
+        return _plan_json_encoder(indent).encode(plan.to_dict())
 
     @staticmethod
     def format_as_sexp(plan: PlanNode) -> str:
@@ -234,6 +234,46 @@ def test_all_transaction_keywords():
     except Exception as e:
         assert_test("测试所有事务相关的关键字", False, str(e))
 
+def test_group_by_order_by_compound():
+    sql = "SELECT dept, COUNT(id) FROM emp GROUP  by dept\nORDER\n BY dept DESC;"
+    lexer = SQLLexer(sql)
+    try:
+        tokens = lexer.tokenize()
+        for token in tokens:
+            print(str(token))
+        group_by = [t for t in tokens if t.type == TokenType.GROUP_BY]
+        order_by = [t for t in tokens if t.type == TokenType.ORDER_BY]
+        cond = (
+            len(group_by) == 1 and group_by[0].value == "GROUP by" and
+            len(order_by) == 1 and order_by[0].value == "ORDER BY" and
+            order_by[0].line == 2 and order_by[0].column == 1 and
+            tokens[-3].type == TokenType.DESC and tokens[-3].line == 3 and
+            not any(t.type == TokenType.BY for t in tokens)
+        )
+        assert_test("测试GROUP BY/ORDER BY合并为单个token", cond)
+    except Exception as e:
+        assert_test("测试GROUP BY/ORDER BY合并为单个token", False, str(e))
+
+def test_chinese_semicolon_error():
+    sql = "SELECT id FROM users；"
+    lexer = SQLLexer(sql)
+    try:
+        tokens = lexer.tokenize()
+        assert_test("测试中文分号错误提示", False, "Expected SyntaxError not raised")
+    except SyntaxError as e:
+        assert_test("测试中文分号错误提示", "中文分号" in str(e) and "列 21" in str(e), str(e))
+
+def test_string_token_unquoted():
+    sql = "INSERT INTO t VALUES ('\\'quoted\\'', \"'x'\");"
+    lexer = SQLLexer(sql)
+    try:
+        tokens = lexer.tokenize()
+        strings = [t.value for t in tokens if t.type == TokenType.STRING]
+        cond = strings == ["'quoted'", "'x'"]
+        assert_test("测试字符串token已去除外层引号且保留内部引号", cond, f"strings: {strings}")
+    except Exception as e:
+        assert_test("测试字符串token已去除外层引号且保留内部引号", False, str(e))
+
 def main():
     test_keywords_and_identifiers()
     test_ddl_statements()
@@ -244,6 +284,9 @@ def main():
     test_illegal_character_error()
     test_unclosed_string_error()
     test_all_transaction_keywords()
+    test_group_by_order_by_compound()
+    test_chinese_semicolon_error()
+    test_string_token_unquoted()
     print_test_summary()
 
 if __name__ == "__main__":
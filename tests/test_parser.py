@@ -5,11 +5,12 @@
 """
 import sys
 import os
+import pickle
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from sql.lexer import SQLLexer
-from sql.parser import SQLParser
+from sql.parser import SQLParser, parse_sql, _tokenize_cached, _PARSE_CACHE_MAX_SQL_LENGTH
 from sql.ast_nodes import *
 from pprint import pprint
 
@@ -547,6 +548,153 @@ def test_syntax_error_set_invalid_param():
     except SyntaxError as e:
         assert_test("测试语法错误：SET非法参数", True, e)
 
+def test_parse_sql_cache():
+    sql = "SELECT id, name FROM users WHERE id > 1;"
+    try:
+        first = parse_sql(sql)
+        second = parse_sql(sql)
+        first.where_clause.right = Literal(99, "INTEGER")
+        cond = (
+            first is not second and
+            isinstance(second, SelectStatement) and
+            second.where_clause.right.value == 1
+        )
+        assert_test("测试parse_sql重复解析返回互不影响的AST", cond)
+    except Exception as e:
+        assert_test("测试parse_sql重复解析返回互不影响的AST", False, str(e))
+
+def test_parse_sql_cache_skips_long_sql():
+    rows = ", ".join(f"({i}, 'name_{i}')" for i in range(500))
+    sql = f"INSERT INTO t VALUES {rows};"
+    try:
+        before = _tokenize_cached.cache_info()
+        ast = parse_sql(sql)
+        after = _tokenize_cached.cache_info()
+        cond = (
+            len(sql) > _PARSE_CACHE_MAX_SQL_LENGTH and
+            len(ast.values) == 500 and
+            after.currsize == before.currsize and after.misses == before.misses
+        )
+        assert_test("测试parse_sql不缓存超长SQL", cond, f"cache: {before} -> {after}")
+    except Exception as e:
+        assert_test("测试parse_sql不缓存超长SQL", False, str(e))
+
+def test_parse_sql_cache_skips_credentials():
+    sqls = [
+        "CREATE USER bob IDENTIFIED BY 'hunter2';",
+        "# 新建用户\ncreate user IF NOT EXISTS alice identified by \"s3cret\";",
+        "GRANT SELECT ON t TO bob;",
+    ]
+    try:
+        before = _tokenize_cached.cache_info()
+        asts = [parse_sql(sql) for sql in sqls]
+        after = _tokenize_cached.cache_info()
+        cond = (
+            isinstance(asts[0], CreateUserStatement) and asts[0].password == "hunter2" and
+            asts[1].password == "s3cret" and isinstance(asts[2], GrantStatement) and
+            after.currsize == before.currsize and after.misses == before.misses
+        )
+        assert_test("测试parse_sql不缓存含凭据的语句", cond, f"cache: {before} -> {after}")
+    except Exception as e:
+        assert_test("测试parse_sql不缓存含凭据的语句", False, str(e))
+
+def test_parse_sql_string_literal_not_shared():
+    try:
+        first = parse_sql("SELECT * FROM t WHERE a = 'k';").where_clause.right
+        second = parse_sql("SELECT * FROM u WHERE b = 'k';").where_clause.right
+        cond = first is not second and first.value == second.value == "k"
+        assert_test("测试不同语句中的相同字符串字面量不共享节点", cond)
+    except Exception as e:
+        assert_test("测试不同语句中的相同字符串字面量不共享节点", False, str(e))
+
+def test_parse_select_star_simple():
+    sql = "SELECT * FROM users WHERE id > 1 ORDER BY id DESC;"
+    try:
+        ast = parse_sql(sql)
+        cond = (
+            isinstance(ast, SelectStatement) and
+            ast.columns == ["*"] and
+            ast.from_table == "users" and
+            isinstance(ast.where_clause, BinaryOp) and
+            len(ast.order_by) == 1 and ast.order_by[0].direction == "DESC"
+        )
+        assert_test("测试解析SELECT * FROM简单查询", cond, f"ast: {ast}")
+    except Exception as e:
+        assert_test("测试解析SELECT * FROM简单查询", False, str(e))
+
+def test_parse_insert_mixed_values():
+    sql = "INSERT INTO t VALUES (1, 'a', NULL, TRUE, 2 + 3, x), (-1.5, FALSE, 'b', 4, y, 0);"
+    try:
+        ast = parse_sql(sql)
+        first, second = ast.values
+        cond = (
+            [v.value for v in first[:4]] == [1, "a", None, True] and
+            isinstance(first[4], BinaryOp) and isinstance(first[5], ColumnRef) and
+            second[0].value == -1.5 and second[0].data_type == "FLOAT" and
+            second[1].value is False and isinstance(second[4], ColumnRef)
+        )
+        assert_test("测试解析INSERT字面量与表达式混合的值行", cond, f"values: {ast.values}")
+    except Exception as e:
+        assert_test("测试解析INSERT字面量与表达式混合的值行", False, str(e))
+
+def test_parse_string_literal_unquoted():
+    insert_sql = "INSERT INTO t VALUES ('Apple', \"'quoted'\");"
+    select_sql = "SELECT * FROM t WHERE name = 'Apple' OR note = \"'x'\";"
+    try:
+        insert_ast = parse_sql(insert_sql)
+        where = parse_sql(select_sql).where_clause
+        cond = (
+            [v.value for v in insert_ast.values[0]] == ["Apple", "'quoted'"] and
+            all(v.data_type == "STRING" for v in insert_ast.values[0]) and
+            where.left.right.value == "Apple" and
+            where.right.right.value == "'x'" and where.right.right.data_type == "STRING"
+        )
+        assert_test("测试INSERT/WHERE字符串字面量去除外层引号且保留内部引号", cond,
+                    f"values: {insert_ast.values}, where: {where}")
+    except Exception as e:
+        assert_test("测试INSERT/WHERE字符串字面量去除外层引号且保留内部引号", False, str(e))
+
+def test_parse_group_order_by_with_comment():
+    sql = "SELECT a, COUNT(*) FROM t GROUP # 分组\n BY a ORDER # 排序\n BY a DESC;"
+    try:
+        ast = parse_sql(sql)
+        cond = (
+            isinstance(ast, SelectStatement) and
+            [str(c) for c in ast.group_by] == ["a"] and
+            len(ast.order_by) == 1 and ast.order_by[0].direction == "DESC"
+        )
+        assert_test("测试GROUP/ORDER与BY之间含注释的解析", cond, f"ast: {ast}")
+    except Exception as e:
+        assert_test("测试GROUP/ORDER与BY之间含注释的解析", False, str(e))
+
+# 引入__slots__之前的版本对CHECK表达式 (e > 0 AND e < 10) 执行pickle.dumps得到的字节，
+# 即旧系统目录中持久化的格式（节点状态为__dict__字典）
+LEGACY_CHECK_PICKLE = (
+    b'\x80\x04\x95)\x01\x00\x00\x00\x00\x00\x00\x8c\rsql.ast_nodes\x94\x8c\tLogicalOp\x94\x93'
+    b'\x94)\x81\x94}\x94(\x8c\x04left\x94h\x00\x8c\x08BinaryOp\x94\x93\x94)\x81\x94}\x94(h\x05'
+    b'h\x00\x8c\tColumnRef\x94\x93\x94)\x81\x94}\x94(\x8c\x0bcolumn_name\x94\x8c\x01e\x94\x8c'
+    b'\ntable_name\x94N\x8c\x04line\x94K\x01\x8c\x06column\x94K"ub\x8c\x08operator\x94\x8c\x01'
+    b'>\x94\x8c\x05right\x94h\x00\x8c\x07Literal\x94\x93\x94)\x81\x94}\x94(\x8c\x05value\x94K'
+    b'\x00\x8c\tdata_type\x94\x8c\x07INTEGER\x94ububh\x13\x8c\x03AND\x94h\x15h\x07)\x81\x94}'
+    b'\x94(h\x05h\x0b)\x81\x94}\x94(h\x0eh\x0fh\x10Nh\x11K\x01h\x12K,ubh\x13\x8c\x01<\x94h\x15'
+    b'h\x17)\x81\x94}\x94(h\x1aK\nh\x1bh\x1cububub.'
+)
+
+def test_unpickle_legacy_check_expression():
+    try:
+        check = pickle.loads(LEGACY_CHECK_PICKLE)
+        left = check.left.left
+        roundtrip = pickle.loads(pickle.dumps(check))
+        cond = (
+            isinstance(check, LogicalOp) and check.operator == "AND" and
+            isinstance(left, ColumnRef) and left.column_name == "e" and left.column == 34 and
+            check.right.right.value == 10 and check.right.right.data_type == "INTEGER" and
+            repr(roundtrip) == repr(check)
+        )
+        assert_test("测试加载旧版本持久化的CHECK表达式", cond, f"check: {check}")
+    except Exception as e:
+        assert_test("测试加载旧版本持久化的CHECK表达式", False, str(e))
+
 def main():
     print_test_coverage()
     test_parse_create_table()
@@ -589,6 +737,15 @@ def main():
     test_syntax_error_fetch_cursor_missing_from()
     test_syntax_error_close_cursor_missing_name()
     test_syntax_error_set_invalid_param()
+    test_parse_sql_cache()
+    test_parse_sql_cache_skips_long_sql()
+    test_parse_sql_cache_skips_credentials()
+    test_parse_sql_string_literal_not_shared()
+    test_parse_select_star_simple()
+    test_parse_insert_mixed_values()
+    test_parse_string_literal_unquoted()
+    test_parse_group_order_by_with_comment()
+    test_unpickle_legacy_check_expression()
 
 
 if __name__ == "__main__":
@@ -308,6 +308,30 @@ def test_plan_output_formats():
         tmpfile.close()
         os.remove(tmpfile.name)
 
+def test_plan_to_dict_deep_tree():
+    """测试深层执行计划树转换为字典和树形字符串（超过递归深度限制）"""
+    depth = sys.getrecursionlimit() + 500
+    plan = SeqScanNode("t")
+    for _ in range(depth):
+        plan = FilterNode(plan, None)
+    try:
+        plan_dict = plan.to_dict()
+        node = plan_dict
+        levels = 0
+        while "children" in node:
+            node = node["children"][0]
+            levels += 1
+        assert_test("测试深层执行计划树转换为字典", levels == depth and node["node_type"] == "SeqScan")
+    except RecursionError as e:
+        assert_test("测试深层执行计划树转换为字典", False, str(e))
+    try:
+        tree = plan.to_tree_string()
+        lines = tree.splitlines()
+        cond = lines[0] == "Filter" and lines[-3] == "  " * depth + "SeqScan on t"
+        assert_test("测试深层执行计划树转换为树形字符串", cond)
+    except RecursionError as e:
+        assert_test("测试深层执行计划树转换为树形字符串", False, str(e))
+
 def main():
     test_plan_create_table()
     test_plan_insert()
@@ -315,6 +339,7 @@ def main():
     test_plan_filter()
     test_plan_project()
     test_plan_output_formats()
+    test_plan_to_dict_deep_tree()
     print_test_summary()
 
 if __name__ == "__main__":